@@ -0,0 +1,50 @@
+from django.core.cache import cache
+from django.utils import timezone
+
+# Cached responses for small, rarely-changing lookup lists
+ROLE_LIST_KEY = 'core:role_list'
+CATEGORY_LIST_KEY = 'core:category_list'
+LIST_CACHE_TIMEOUT = 300
+
+# Stats responses are aggregates over busy tables, so they only live briefly
+PRODUCT_STATS_KEY = 'core:product_stats'
+INVENTORY_STATS_KEY = 'core:inventory_stats'
+DASHBOARD_STATS_KEY = 'core:dashboard_stats'
+SALES_STATS_GENERATION_KEY = 'core:sales_stats_generation'
+STATS_CACHE_TIMEOUT = 60
+
+
+def invalidate(*keys):
+    cache.delete_many(keys)
+
+
+def inventory_report_key(day=None):
+    """The inventory report's movement windows end today, so each day gets its own entry"""
+    return f'core:inventory_report:{day or timezone.localdate()}'
+
+
+def stock_stats_keys():
+    return (PRODUCT_STATS_KEY, INVENTORY_STATS_KEY, DASHBOARD_STATS_KEY, inventory_report_key())
+
+
+def sales_stats_key(*parts):
+    """Key for one variant of the sales stats; bumping the generation drops them all"""
+    generation = cache.get_or_set(SALES_STATS_GENERATION_KEY, 1, None)
+    return ':'.join(['core:sales_stats', str(generation), *map(str, parts)])
+
+
+def invalidate_sales_stats():
+    try:
+        cache.incr(SALES_STATS_GENERATION_KEY)
+    except ValueError:
+        pass
+
+
+def invalidate_stock_stats():
+    """Everything cached from product stock levels, the dashboard included"""
+    invalidate(*stock_stats_keys())
+
+
+def invalidate_stats():
+    invalidate_stock_stats()
+    invalidate_sales_stats()
@@ -0,0 +1,54 @@
+import json
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.models import User, Role
+
+
+class Command(BaseCommand):
+    help = 'Check the role data returned with the admin user\'s JWT, assigning the admin role if missing'
+
+    def handle(self, *args, **options):
+        self.stdout.write('🔍 Testing JWT response...')
+        
+        try:
+            admin = User.objects.get(username='admin')
+        except User.DoesNotExist:
+            self.stdout.write(self.style.ERROR('❌ Admin user not found!'))
+            return
+        
+        self.stdout.write(f'\n👤 User: {admin.username}')
+        self.stdout.write(f'📧 Email: {admin.email}')
+        self.stdout.write(f'🎭 Role object: {admin.role}')
+        
+        if admin.role:
+            self.stdout.write(f'✅ Role name: {admin.role.name}')
+            self.stdout.write(f'✅ Role display: {admin.role.name_display}')
+        else:
+            self.stdout.write(self.style.WARNING('❌ NO ROLE ASSIGNED!'))
+            self.stdout.write('\n🔧 Fixing role...')
+            admin.role = Role.objects.get(name=Role.ADMIN)
+            admin.save()
+            self.stdout.write(self.style.SUCCESS('✅ Role assigned!'))
+        
+        self.stdout.write('\n🔑 Generating test tokens...')
+        refresh = RefreshToken.for_user(admin)
+        self.stdout.write(f'✅ Refresh token: {str(refresh)[:50]}...')
+        self.stdout.write(f'✅ Access token: {str(refresh.access_token)[:50]}...')
+        
+        # What the custom token serializer should return
+        user_data = {
+            'id': admin.id,
+            'username': admin.username,
+            'email': admin.email,
+            'first_name': admin.first_name,
+            'last_name': admin.last_name,
+            'role': admin.role.name if admin.role else None,
+            'role_display': admin.role.name_display if admin.role else None,
+        }
+        self.stdout.write('\n📦 User data that should be returned:')
+        self.stdout.write(json.dumps(user_data, indent=2))
+        
+        if user_data['role'] is None:
+            self.stdout.write(self.style.ERROR('\n❌ PROBLEM: Role is None!'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Everything looks good! Role: {user_data['role']}"))
@@ -17,19 +17,25 @@ roles_data = [
     {'name': 'cashier', 'description': 'Cashier access'},
 ]
 
-for role_data in roles_data:
-    role, created = Role.objects.get_or_create(
-        name=role_data['name'],
-        defaults={'description': role_data['description']}
-    )
-    status = "created" if created else "exists"
+existing_roles = set(
+    Role.objects.filter(name__in=[r['name'] for r in roles_data]).values_list('name', flat=True)
+)
+role_objs = [Role(**role_data) for role_data in roles_data]
+Role.objects.bulk_create(
+    role_objs,
+    update_conflicts=True,
+    unique_fields=['name'],
+    update_fields=['description'],
+    batch_size=500,
+)
+for role in role_objs:
+    status = "exists" if role.name in existing_roles else "created"
     print(f"   ✓ {role.name} ({status})")
 
 # Step 2: Create/Fix Users
 print("\n2️⃣ Setting up users...")
-admin_role = Role.objects.get(name='admin')
-manager_role = Role.objects.get(name='manager')
-cashier_role = Role.objects.get(name='cashier')
+roles = Role.objects.by_name()
+admin_role, manager_role, cashier_role = roles['admin'], roles['manager'], roles['cashier']
 
 users_data = [
     {
@@ -60,19 +66,30 @@ users_data = [
     },
 ]
 
-for user_data in users_data:
-    password = user_data.pop('password')
-    username = user_data['username']
-    
-    user, created = User.objects.update_or_create(
-        username=username,
-        defaults=user_data
-    )
-    user.set_password(password)
-    user.save()
-    
-    status = "created" if created else "updated"
-    print(f"   ✓ {username} ({status}) - role: {user.role.name}")
+passwords = {user_data['username']: user_data.pop('password') for user_data in users_data}
+existing_users = set(
+    User.objects.filter(username__in=passwords).values_list('username', flat=True)
+)
+
+user_objs = [User(**user_data) for user_data in users_data]
+for user in user_objs:
+    user.role_name = user.role.name
+    user.set_password(passwords[user.username])
+
+User.objects.bulk_create(
+    user_objs,
+    update_conflicts=True,
+    unique_fields=['username'],
+    update_fields=[
+        'email', 'first_name', 'last_name', 'password',
+        'role', 'role_name', 'is_superuser', 'is_staff',
+    ],
+    batch_size=500,
+)
+
+for user in user_objs:
+    status = "updated" if user.username in existing_users else "created"
+    print(f"   ✓ {user.username} ({status}) - role: {user.role.name}")
 
 # Step 3: Verify
 print("\n3️⃣ Verification...")
@@ -7,62 +7,70 @@ class Command(BaseCommand):
 
     def handle(self, *args, **kwargs):
         # Get roles
-        admin_role = Role.objects.get(name='admin')
-        manager_role = Role.objects.get(name='manager')
-        cashier_role = Role.objects.get(name='cashier')
+        roles = Role.objects.by_name()
+        admin_role, manager_role, cashier_role = roles['admin'], roles['manager'], roles['cashier']
 
-        # Create admin user
-        admin, created = User.objects.get_or_create(
-            username='admin',
-            defaults={
+        users_data = [
+            {
+                'label': 'Admin',
+                'username': 'admin',
+                'password': 'admin123',
                 'email': 'admin@pos.com',
                 'first_name': 'Admin',
                 'last_name': 'User',
                 'role': admin_role,
-            }
-        )
-        if created:
-            admin.set_password('admin123')
-            admin.save()
-            self.stdout.write(self.style.SUCCESS(f'✓ Admin user created: {admin.username}'))
-        else:
-            self.stdout.write(self.style.WARNING(f'Admin user already exists: {admin.username}'))
-
-        # Create manager user
-        manager, created = User.objects.get_or_create(
-            username='manager',
-            defaults={
+            },
+            {
+                'label': 'Manager',
+                'username': 'manager',
+                'password': 'manager123',
                 'email': 'manager@pos.com',
                 'first_name': 'Manager',
                 'last_name': 'User',
                 'role': manager_role,
-            }
-        )
-        if created:
-            manager.set_password('manager123')
-            manager.save()
-            self.stdout.write(self.style.SUCCESS(f'✓ Manager user created: {manager.username}'))
-        else:
-            self.stdout.write(self.style.WARNING(f'Manager user already exists: {manager.username}'))
-
-        # Create cashier user
-        cashier, created = User.objects.get_or_create(
-            username='cashier',
-            defaults={
+            },
+            {
+                'label': 'Cashier',
+                'username': 'cashier',
+                'password': 'cashier123',
                 'email': 'cashier@pos.com',
                 'first_name': 'Cashier',
                 'last_name': 'User',
                 'role': cashier_role,
-            }
+            },
+        ]
+
+        existing = set(
+            User.objects.filter(
+                username__in=[u['username'] for u in users_data]
+            ).values_list('username', flat=True)
+        )
+
+        # Build all missing users in memory and insert them in one statement
+        new_users = []
+        for user_data in users_data:
+            label = user_data.pop('label')
+            password = user_data.pop('password')
+            username = user_data['username']
+
+            if username in existing:
+                self.stdout.write(self.style.WARNING(f'{label} user already exists: {username}'))
+                continue
+
+            user = User(**user_data, role_name=user_data['role'].name)
+            user.set_password(password)
+            new_users.append(user)
+            self.stdout.write(self.style.SUCCESS(f'✓ {label} user created: {username}'))
+
+        User.objects.bulk_create(
+            new_users,
+            update_conflicts=True,
+            unique_fields=['username'],
+            update_fields=['email', 'first_name', 'last_name', 'role', 'role_name', 'password'],
+            batch_size=500,
         )
-        if created:
-            cashier.set_password('cashier123')
-            cashier.save()
-            self.stdout.write(self.style.SUCCESS(f'✓ Cashier user created: {cashier.username}'))
-        else:
-            self.stdout.write(self.style.WARNING(f'Cashier user already exists: {cashier.username}'))
 
         self.stdout.write(self.style.SUCCESS('\n=== Test Users Created ==='))
         self.stdout.write('Admin    - username: admin    password: admin123')
         self.stdout.write('Manager  - username: manager  password: manager123')
-        self.stdout.write('Cashier  - username: cashier  password: cashier123')
\ No newline at end of file
+        self.stdout.write('Cashier  - username: cashier  password: cashier123')
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from core.models import User, Role
+
+
+class Command(BaseCommand):
+    help = 'Move every superuser that is not an admin yet to the admin role'
+
+    def handle(self, *args, **options):
+        try:
+            admin_role = Role.objects.get(name=Role.ADMIN)
+        except Role.DoesNotExist:
+            self.stdout.write(self.style.ERROR('Admin role not found'))
+            return
+        
+        # Log from one narrow read, then move them all in a single UPDATE
+        superusers = User.objects.filter(is_superuser=True).exclude(role=admin_role)
+        for username, old_role in superusers.values_list('username', 'role__name'):
+            self.stdout.write(f"✅ {username}: {old_role or 'No Role'} → admin")
+        
+        count = superusers.update(role=admin_role, role_name=admin_role.name)
+        self.stdout.write(self.style.SUCCESS(f'✅ Updated {count} superusers'))
@@ -28,9 +28,9 @@ class Command(BaseCommand):
             )
             if created:
                 self.stdout.write(
-                    self.style.SUCCESS(f'Successfully created role: {role.get_name_display()}')
+                    self.style.SUCCESS(f'Successfully created role: {role.name_display}')
                 )
             else:
                 self.stdout.write(
-                    self.style.WARNING(f'Role already exists: {role.get_name_display()}')
+                    self.style.WARNING(f'Role already exists: {role.name_display}')
                 )
\ No newline at end of file
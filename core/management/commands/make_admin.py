@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from core.models import User, Role
 
+
 class Command(BaseCommand):
     help = 'Give a user admin role'
 
@@ -17,7 +18,7 @@ class Command(BaseCommand):
             return
         
         try:
-            admin_role = Role.objects.get(name='admin')
+            admin_role = Role.objects.get(name=Role.ADMIN)
         except Role.DoesNotExist:
             self.stdout.write(self.style.ERROR('Admin role not found'))
             return
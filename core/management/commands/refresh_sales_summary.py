@@ -0,0 +1,42 @@
+import time
+from django.core.management.base import BaseCommand
+from core.models import DailyProductSales
+
+REFRESH_INTERVAL = 15 * 60
+
+
+class Command(BaseCommand):
+    """
+    Schedule one of these on Postgres so the product reports lag live
+    sales by at most 15 minutes, either from cron:
+
+        */15 * * * * cd /path/to/pos && python manage.py refresh_sales_summary
+
+    or as a long-running process under the same supervisor as gunicorn:
+
+        python manage.py refresh_sales_summary --loop
+    """
+    help = 'Refresh the daily product sales summary behind the product reports'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep running, refreshing every --interval seconds'
+        )
+        parser.add_argument(
+            '--interval', type=int, default=REFRESH_INTERVAL,
+            help=f'Seconds between refreshes with --loop (default {REFRESH_INTERVAL})'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.refresh()
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def refresh(self):
+        if DailyProductSales.refresh():
+            self.stdout.write(self.style.SUCCESS('✓ Daily product sales refreshed'))
+        else:
+            self.stdout.write('Daily product sales is a live view on this database; nothing to refresh')
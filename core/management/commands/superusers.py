@@ -1,12 +1,14 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from core.models import User, Role
 
+
 class Command(BaseCommand):
     help = 'Give admin role to all Django superusers'
 
     def handle(self, *args, **options):
         try:
-            admin_role = Role.objects.get(name='admin')
+            admin_role = Role.objects.get(name=Role.ADMIN)
         except Role.DoesNotExist:
             self.stdout.write(self.style.ERROR('Admin role not found'))
             return
@@ -14,12 +16,13 @@ class Command(BaseCommand):
         # Get all superusers without admin role
         superusers = User.objects.filter(is_superuser=True, role__isnull=True)
         
-        count = 0
-        for user in superusers:
-            user.role = admin_role
-            user.save()
-            count += 1
-            self.stdout.write(f'✅ {user.username} -> admin')
+        with transaction.atomic():
+            # Stream just the usernames for logging instead of loading full rows
+            usernames = superusers.values_list('username', flat=True)
+            for username in usernames.iterator(chunk_size=500):
+                self.stdout.write(f'✅ {username} -> admin')
+            
+            count = superusers.update(role=admin_role, role_name=admin_role.name)
         
         if count == 0:
             self.stdout.write(self.style.WARNING('No superusers found without admin role'))
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:22
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_role_name(apps, schema_editor):
+    User = apps.get_model('core', 'User')
+    Role = apps.get_model('core', 'Role')
+    User.objects.filter(role__isnull=False).update(
+        role_name=Subquery(Role.objects.filter(pk=OuterRef('role_id')).values('name')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='role_name',
+            field=models.CharField(blank=True, choices=[('admin', 'Admin'), ('manager', 'Manager'), ('cashier', 'Cashier')], db_index=True, editable=False, max_length=20),
+        ),
+        migrations.RunPython(populate_role_name, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='payment',
+            name='payment_method',
+            field=models.CharField(choices=[('cash', 'Cash'), ('card', 'Card'), ('mobile', 'M-Pesa')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='sale',
+            name='payment_method',
+            field=models.CharField(choices=[('cash', 'Cash'), ('card', 'Card'), ('mobile', 'M-Pesa')], default='cash', max_length=20),
+        ),
+    ]
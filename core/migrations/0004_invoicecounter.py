@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_user_manager'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvoiceCounter',
+            fields=[
+                ('date', models.DateField(primary_key=True, serialize=False)),
+                ('seq', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'invoice_counters',
+            },
+        ),
+    ]
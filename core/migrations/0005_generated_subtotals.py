@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:24
+
+import django.db.models.expressions
+import django.db.models.functions.math
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_invoicecounter'),
+    ]
+
+    # A plain column can't be altered into a generated one, so the subtotal
+    # columns are dropped and re-added; the database recomputes every row.
+    operations = [
+        migrations.RemoveField(
+            model_name='purchaseorderitem',
+            name='subtotal',
+        ),
+        migrations.AddField(
+            model_name='purchaseorderitem',
+            name='subtotal',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('unit_cost'), '*', models.F('quantity_ordered')), output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+        migrations.RemoveField(
+            model_name='saleitem',
+            name='subtotal',
+        ),
+        migrations.AddField(
+            model_name='saleitem',
+            name='subtotal',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('unit_price'), '*', models.F('quantity')), '*', django.db.models.expressions.CombinedExpression(models.Value(1), '-', django.db.models.expressions.CombinedExpression(models.F('discount_percent'), '*', models.Value(Decimal('0.01'))))), '*', django.db.models.expressions.CombinedExpression(models.Value(1), '+', django.db.models.expressions.CombinedExpression(models.F('tax_rate'), '*', models.Value(Decimal('0.01'))))), 2), output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:29
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def resolve_duplicate_alerts(apps, schema_editor):
+    """Keep only the newest open alert per product so the constraint applies"""
+    StockAlert = apps.get_model('core', 'StockAlert')
+    open_alerts = StockAlert.objects.filter(is_resolved=False)
+    latest = open_alerts.values('product_id').annotate(keep=Max('id')).values('keep')
+    open_alerts.exclude(id__in=latest).update(is_resolved=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_query_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(resolve_duplicate_alerts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='stockalert',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_resolved', False)), fields=('product',), name='stock_alerts_open_uniq'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:30
+
+from django.db import migrations
+
+TABLES = ['roles', 'users', 'categories', 'products', 'sales', 'suppliers', 'purchase_orders']
+
+# Only stamp rows whose UPDATE left updated_at alone (QuerySet.update(),
+# bulk_update()); save() already sends its auto_now value, which the
+# instance then keeps
+PG_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at = now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def create_triggers(apps, schema_editor):
+    """Stamp updated_at on the UPDATEs auto_now never sees. Postgres only:
+    SQLite can't assign NEW in a trigger, and its table rebuilds drop them"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(PG_FUNCTION)
+    for table in TABLES:
+        schema_editor.execute(
+            f'CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION set_updated_at();'
+        )
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in TABLES:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table};')
+    schema_editor.execute('DROP FUNCTION IF EXISTS set_updated_at();')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_stock_alert_open_uniq'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_user_is_active_inherited'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='saleitem',
+            index=models.Index(fields=['sale', 'product'], name='sale_items_sale_id_02f224_idx'),
+        ),
+    ]
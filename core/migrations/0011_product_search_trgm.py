@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-14 18:52
+
+from django.db import migrations
+
+COLUMNS = ['name', 'sku', 'barcode']
+
+
+def create_search_indexes(apps, schema_editor):
+    """Trigram indexes let Postgres answer ProductSearchView's
+    `icontains` lookups (UPPER(col) LIKE UPPER('%q%')) from an index"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    for column in COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS products_{column}_trgm ON products '
+            f'USING gin (UPPER({column}) gin_trgm_ops);'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS products_{column}_trgm;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_sale_item_sale_product_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
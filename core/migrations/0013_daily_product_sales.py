@@ -0,0 +1,58 @@
+# Generated by Django 5.0.1 on 2026-10-14 19:01
+
+from django.db import migrations, models
+
+SELECT = """
+    SELECT ROW_NUMBER() OVER (ORDER BY si.product_id, {day}) AS id,
+           si.product_id, {day} AS day,
+           SUM(si.quantity) AS quantity, SUM(si.subtotal) AS revenue,
+           COUNT(*) AS times_sold
+    FROM sale_items si JOIN sales s ON s.id = si.sale_id
+    WHERE s.status = 'completed'
+    GROUP BY si.product_id, {day}
+"""
+
+
+def create_view(apps, schema_editor):
+    """Materialized on Postgres, refreshed out of band; elsewhere a plain
+    view so the model still reads live figures"""
+    if schema_editor.connection.vendor == 'postgresql':
+        day = "(s.created_at AT TIME ZONE 'UTC')::date"
+        schema_editor.execute(f'CREATE MATERIALIZED VIEW daily_product_sales AS {SELECT.format(day=day)};')
+        # CONCURRENTLY refreshes need a unique index
+        schema_editor.execute('CREATE UNIQUE INDEX daily_product_sales_key ON daily_product_sales (product_id, day);')
+        schema_editor.execute('CREATE INDEX daily_product_sales_day ON daily_product_sales (day);')
+    else:
+        schema_editor.execute(f'CREATE VIEW daily_product_sales AS {SELECT.format(day="date(s.created_at)")};')
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP MATERIALIZED VIEW IF EXISTS daily_product_sales;')
+    else:
+        schema_editor.execute('DROP VIEW IF EXISTS daily_product_sales;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_product_low_stock_partial_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyProductSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('quantity', models.IntegerField()),
+                ('revenue', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('times_sold', models.IntegerField()),
+            ],
+            options={
+                'db_table': 'daily_product_sales',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_view, drop_view),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.1 on 2026-10-14 19:03
+
+from django.db import migrations, models
+
+INDEX = models.Index(
+    condition=models.Q(('status', 'completed')),
+    fields=['created_at'],
+    name='sale_completed_idx',
+)
+
+
+def create_index(apps, schema_editor):
+    """On Postgres, INCLUDE (cashier_id, total) lets the dashboard and
+    cashier aggregates answer from the index alone. Other databases don't
+    support INCLUDE, and Django warns (models.W040) if the model asks for
+    it, so the model only declares the plain partial index"""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE INDEX sale_completed_idx ON sales (created_at) "
+            "INCLUDE (cashier_id, total) WHERE status = 'completed';"
+        )
+    else:
+        schema_editor.add_index(apps.get_model('core', 'Sale'), INDEX)
+
+
+def drop_index(apps, schema_editor):
+    schema_editor.remove_index(apps.get_model('core', 'Sale'), INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_daily_product_sales'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.RunPython(create_index, drop_index)],
+            state_operations=[migrations.AddIndex(model_name='sale', index=INDEX)],
+        ),
+    ]
@@ -1,8 +1,49 @@
-from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
+from django.db import models, transaction
+from django.db.models import Case, ExpressionWrapper, F, Prefetch, Q, Value, When
+from django.db.models.functions import Round
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from decimal import Decimal
-import uuid
+import random
+from .cache import invalidate_stock_stats
+
+
+class PaymentMethod(models.TextChoices):
+    CASH = 'cash', 'Cash'
+    CARD = 'card', 'Card'
+    MOBILE = 'mobile', 'M-Pesa'
+
+
+class SaleStatus(models.TextChoices):
+    COMPLETED = 'completed', 'Completed'
+    PENDING = 'pending', 'Pending'
+    CANCELLED = 'cancelled', 'Cancelled'
+
+
+class MovementType(models.TextChoices):
+    PURCHASE = 'purchase', 'Purchase'
+    SALE = 'sale', 'Sale'
+    ADJUSTMENT = 'adjustment', 'Adjustment'
+    RETURN = 'return', 'Return'
+    DAMAGE = 'damage', 'Damage/Loss'
+
+
+class PurchaseOrderStatus(models.TextChoices):
+    DRAFT = 'draft', 'Draft'
+    PENDING = 'pending', 'Pending'
+    RECEIVED = 'received', 'Received'
+    CANCELLED = 'cancelled', 'Cancelled'
+
+
+_PAYMENT_METHOD_DISPLAY = dict(PaymentMethod.choices)
+
+
+class RoleManager(models.Manager):
+    def by_name(self):
+        """Every role keyed by name, in one query, e.g. roles[Role.CASHIER]"""
+        return self.in_bulk([name for name, _ in self.model.ROLE_CHOICES], field_name='name')
+
 
 class Role(models.Model):
     """User roles for POS system"""
@@ -21,13 +62,45 @@ class Role(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = RoleManager()
+    
+    @property
+    def name_display(self):
+        return _ROLE_DISPLAY.get(self.name, self.name)
+    
     def __str__(self):
-        return self.get_name_display()
+        return self.name_display
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Keep the denormalized role name on users in step
+        self.users.exclude(role_name=self.name).update(role_name=self.name)
     
     class Meta:
         db_table = 'roles'
 
 
+# Choice labels resolved once instead of per get_FOO_display() call
+_ROLE_DISPLAY = dict(Role.ROLE_CHOICES)
+
+
+class UserManager(BaseUserManager):
+    """Default user manager that always joins the role"""
+    
+    # Columns needed to authenticate a request and run permission checks
+    AUTH_FIELDS = (
+        'id', 'username', 'password', 'role', 'role_name',
+        'is_superuser', 'is_staff', 'is_active',
+    )
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('role')
+    
+    def for_auth(self):
+        """Narrow user row for per-request authentication"""
+        return self.get_queryset().select_related(None).only(*self.AUTH_FIELDS)
+
+
 class User(AbstractUser):
     """Custom user model with role-based access"""
     role = models.ForeignKey(
@@ -36,26 +109,49 @@ class User(AbstractUser):
         null=True, 
         related_name='users'
     )
+    # Denormalized copy of role.name so permission checks don't hit the roles table
+    role_name = models.CharField(
+        max_length=20,
+        choices=Role.ROLE_CHOICES,
+        blank=True,
+        editable=False,
+        db_index=True
+    )
     phone = models.CharField(max_length=15, blank=True)
     address = models.TextField(blank=True)
-    is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserManager()
+    
     def __str__(self):
-        return f"{self.username} ({self.role.name if self.role else 'No Role'})"
+        return f"{self.username} ({self.role_name or 'No Role'})"
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        # Partial saves that leave role alone (password, last_login) don't
+        # write role_name either, so skip loading the role for them
+        if update_fields is None or 'role' in update_fields:
+            self.role_name = self.role.name if self.role_id else ''
+        if update_fields is not None and 'role' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'role_name'}
+        super().save(*args, **kwargs)
+    
+    @property
+    def role_display(self):
+        return _ROLE_DISPLAY.get(self.role_name, self.role_name)
     
     @property
     def is_admin(self):
-        return self.role and self.role.name == Role.ADMIN
+        return self.role_name == Role.ADMIN
     
     @property
     def is_manager(self):
-        return self.role and self.role.name == Role.MANAGER
+        return self.role_name == Role.MANAGER
     
     @property
     def is_cashier(self):
-        return self.role and self.role.name == Role.CASHIER
+        return self.role_name == Role.CASHIER
     
     class Meta:
         db_table = 'users'
@@ -78,6 +174,34 @@ class Category(models.Model):
         ordering = ['name']
 
 
+class ProductQuerySet(models.QuerySet):
+    def with_low_stock(self):
+        """Annotate `low_stock` so the database does the stock comparison"""
+        return self.annotate(
+            low_stock=ExpressionWrapper(
+                Q(stock_quantity__lte=F('min_stock_level')),
+                output_field=models.BooleanField()
+            )
+        )
+    
+    def for_list(self):
+        """Only the columns ProductListSerializer renders (min_stock_level feeds is_low_stock)"""
+        return self.select_related('category').only(
+            'id', 'name', 'sku', 'barcode', 'price', 'stock_quantity',
+            'min_stock_level', 'is_active', 'image', 'category__id', 'category__name'
+        )
+    
+    def add_stock(self, quantities):
+        """Add `{product_id: quantity}` to stock_quantity in a single UPDATE"""
+        if not quantities:
+            return 0
+        return self.filter(pk__in=quantities).update(stock_quantity=Case(
+            *[When(pk=pk, then=F('stock_quantity') + quantity)
+              for pk, quantity in quantities.items()],
+            default=F('stock_quantity'),
+        ))
+
+
 class Product(models.Model):
     """Product catalog"""
     name = models.CharField(max_length=200)
@@ -127,6 +251,8 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProductQuerySet.as_manager()
+    
     def __str__(self):
         return f"{self.name} ({self.sku})"
     
@@ -155,23 +281,75 @@ class Product(models.Model):
             models.Index(fields=['sku']),
             models.Index(fields=['barcode']),
             models.Index(fields=['name']),
+            models.Index(fields=['category', 'is_active', '-created_at']),
+            models.Index(fields=['stock_quantity', 'min_stock_level'], name='prod_low_idx', condition=Q(is_active=True)),
         ]
         
 ##
-class Sale(models.Model):
-    """Sales transaction"""
-    PAYMENT_METHOD_CHOICES = [
-        ('cash', 'Cash'),
-        ('card', 'Card'),
-        ('mobile', 'M-Pesa'),
-    ]
+class BulkInsertManager(models.Manager):
+    """Manager for rows written many-per-transaction (sale items, movements...)"""
     
-    STATUS_CHOICES = [
-        ('completed', 'Completed'),
-        ('pending', 'Pending'),
-        ('cancelled', 'Cancelled'),
-    ]
+    def bulk_insert(self, objs, batch_size=1000):
+        return self.bulk_create(objs, batch_size=batch_size)
+
+
+class SaleQuerySet(models.QuerySet):
+    def with_all(self):
+        """
+        Fetch everything a sale list/receipt renders in a fixed number of
+        queries; views should start from Sale.objects.with_all().
+        """
+        return self.select_related('cashier__role').prefetch_related(
+            Prefetch('items', queryset=SaleItem.objects.only(
+                'id', 'sale_id', 'product_id', 'product_name', 'product_sku',
+                'quantity', 'unit_price', 'tax_rate', 'discount_percent', 'subtotal'
+            )),
+            Prefetch('payments', queryset=Payment.objects.only(
+                'id', 'sale_id', 'payment_method', 'amount', 'reference_number', 'notes'
+            )),
+        )
+
+
+class SaleManager(BulkInsertManager.from_queryset(SaleQuerySet)):
+    def bulk_create_with_invoices(self, objs, batch_size=500):
+        """Bulk insert sales, numbering them from one counter reservation"""
+        objs = list(objs)
+        unnumbered = [obj for obj in objs if not obj.invoice_number]
+        if unnumbered:
+            today = timezone.localdate()
+            first_seq = InvoiceCounter.allocate(today, count=len(unnumbered))
+            for seq, obj in enumerate(unnumbered, start=first_seq):
+                obj.invoice_number = _invoice_number(today, seq)
+        return self.bulk_create(objs, batch_size=batch_size)
+
+
+def _invoice_number(date, seq):
+    return f'INV-{date:%Y%m%d}-{seq:06d}'
+
+
+class InvoiceCounter(models.Model):
+    """Per-day sequence used to number sales invoices"""
+    date = models.DateField(primary_key=True)
+    seq = models.BigIntegerField(default=0)
+    
+    @classmethod
+    def allocate(cls, date, count=1):
+        """Reserve `count` consecutive numbers for `date` and return the first"""
+        with transaction.atomic():
+            counter, _ = cls.objects.select_for_update().get_or_create(date=date)
+            counter.seq += count
+            counter.save(update_fields=['seq'])
+        return counter.seq - count + 1
     
+    def __str__(self):
+        return f"{self.date:%Y-%m-%d} #{self.seq}"
+    
+    class Meta:
+        db_table = 'invoice_counters'
+
+
+class Sale(models.Model):
+    """Sales transaction"""
     invoice_number = models.CharField(max_length=50, unique=True, editable=False)
     cashier = models.ForeignKey(
         'User',
@@ -203,8 +381,8 @@ class Sale(models.Model):
     )
     payment_method = models.CharField(
         max_length=20,
-        choices=PAYMENT_METHOD_CHOICES,
-        default='cash'
+        choices=PaymentMethod.choices,
+        default=PaymentMethod.CASH
     )
     amount_paid = models.DecimalField(
         max_digits=10,
@@ -219,22 +397,87 @@ class Sale(models.Model):
     )
     status = models.CharField(
         max_length=20,
-        choices=STATUS_CHOICES,
-        default='completed'
+        choices=SaleStatus.choices,
+        default=SaleStatus.COMPLETED
     )
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SaleManager()
+    
     def save(self, *args, **kwargs):
         if not self.invoice_number:
-            # Generate unique invoice number
-            from django.utils import timezone
-            date_str = timezone.now().strftime('%Y%m%d')
-            random_str = str(uuid.uuid4())[:8].upper()
-            self.invoice_number = f'INV-{date_str}-{random_str}'
+            self.invoice_number = self.next_invoice_number()
         super().save(*args, **kwargs)
     
+    @staticmethod
+    def next_invoice_number():
+        """
+        Take the next sequential invoice number for today. The day's counter
+        row stays locked until the enclosing transaction ends, so checkouts
+        call this before opening theirs; a failed checkout leaves a gap.
+        """
+        today = timezone.localdate()
+        return _invoice_number(today, InvoiceCounter.allocate(today))
+    
+    @classmethod
+    def finalize(cls, sale, line_items, user=None):
+        """
+        Write the items of a saved sale and take their quantities out of stock.
+        
+        `line_items` are dicts with `product_id`, `quantity` and optionally
+        `discount_percent`, `unit_price` and `tax_rate` (defaulting to the
+        product's current values), already validated against stock. The
+        products are locked and every write is batched, so the query count
+        doesn't grow with the number of lines.
+        """
+        with transaction.atomic():
+            product_ids = [item['product_id'] for item in line_items]
+            products = Product.objects.select_for_update().in_bulk(product_ids)
+            
+            sale_items = []
+            movements = []
+            for item in line_items:
+                product = products[item['product_id']]
+                quantity = item['quantity']
+                previous_quantity = product.stock_quantity
+                product.stock_quantity = previous_quantity - quantity
+                
+                sale_items.append(SaleItem(
+                    sale=sale,
+                    product=product,
+                    product_name=product.name,
+                    product_sku=product.sku,
+                    quantity=quantity,
+                    unit_price=item.get('unit_price', product.price),
+                    tax_rate=item.get('tax_rate', product.tax_rate),
+                    discount_percent=item.get('discount_percent', 0)
+                ))
+                movements.append(StockMovement(
+                    product=product,
+                    movement_type='sale',
+                    quantity=-quantity,
+                    previous_quantity=previous_quantity,
+                    new_quantity=product.stock_quantity,
+                    sale=sale,
+                    user=user
+                ))
+            
+            SaleItem.objects.bulk_insert(sale_items, batch_size=500)
+            StockMovement.objects.bulk_insert(movements, batch_size=500)
+            Product.objects.bulk_update(products.values(), ['stock_quantity'], batch_size=500)
+        
+        return sale_items
+    
+    @property
+    def payment_method_display(self):
+        return _PAYMENT_METHOD_DISPLAY.get(self.payment_method, self.payment_method)
+    
+    @property
+    def status_display(self):
+        return _SALE_STATUS_DISPLAY.get(self.status, self.status)
+    
     def __str__(self):
         return f"{self.invoice_number} - ${self.total}"
     
@@ -242,12 +485,18 @@ class Sale(models.Model):
         db_table = 'sales'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['invoice_number']),
             models.Index(fields=['cashier', '-created_at']),
             models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['payment_method', '-created_at']),
+            # Covering on Postgres; the INCLUDE is added in migration 0014
+            models.Index(fields=['created_at'], name='sale_completed_idx', condition=Q(status='completed')),
         ]
 
 
+_SALE_STATUS_DISPLAY = dict(SaleStatus.choices)
+
+
 class SaleItem(models.Model):
     """Individual items in a sale"""
     sale = models.ForeignKey(
@@ -280,36 +529,66 @@ class SaleItem(models.Model):
         default=0,
         validators=[MinValueValidator(Decimal('0.00'))]
     )
-    subtotal = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        validators=[MinValueValidator(Decimal('0.00'))]
+    # Computed by the database: (price * qty) less discount, plus tax on the rest
+    subtotal = models.GeneratedField(
+        expression=Round(
+            F('unit_price') * F('quantity')
+            * (1 - F('discount_percent') * Value(Decimal('0.01')))
+            * (1 + F('tax_rate') * Value(Decimal('0.01'))),
+            2
+        ),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = BulkInsertManager()
+    
     def __str__(self):
         return f"{self.product_name} x {self.quantity}"
     
-    def save(self, *args, **kwargs):
-        # Calculate subtotal
-        base_amount = self.unit_price * self.quantity
-        discount = base_amount * (self.discount_percent / 100)
-        tax = (base_amount - discount) * (self.tax_rate / 100)
-        self.subtotal = base_amount - discount + tax
-        super().save(*args, **kwargs)
-    
     class Meta:
         db_table = 'sale_items'
+        indexes = [
+            models.Index(fields=['sale', 'product']),
+        ]
+
+
+class DailyProductSales(models.Model):
+    """
+    Completed sales per product per (UTC) day, read from the
+    daily_product_sales view. On Postgres the view is materialized and
+    refreshed every 15 minutes by `manage.py refresh_sales_summary`
+    (see that command for the schedule), so it may lag live sales.
+    """
+    product = models.ForeignKey(
+        'Product',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='+'
+    )
+    day = models.DateField()
+    quantity = models.IntegerField()
+    revenue = models.DecimalField(max_digits=12, decimal_places=2)
+    times_sold = models.IntegerField()
+    
+    @classmethod
+    def refresh(cls):
+        """Rebuild the materialized view without blocking readers"""
+        from django.db import connection
+        if connection.vendor != 'postgresql':
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}')
+        return True
+    
+    class Meta:
+        managed = False
+        db_table = 'daily_product_sales'
 
 
 class Payment(models.Model):
     """Payment details for a sale"""
-    PAYMENT_METHOD_CHOICES = [
-        ('cash', 'Cash'),
-        ('card', 'Card'),
-        ('mobile', 'M-Pesa'),
-    ]
-    
     sale = models.ForeignKey(
         Sale,
         on_delete=models.CASCADE,
@@ -317,7 +596,7 @@ class Payment(models.Model):
     )
     payment_method = models.CharField(
         max_length=20,
-        choices=PAYMENT_METHOD_CHOICES
+        choices=PaymentMethod.choices
     )
     amount = models.DecimalField(
         max_digits=10,
@@ -328,11 +607,18 @@ class Payment(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = BulkInsertManager()
+    
+    @property
+    def payment_method_display(self):
+        return _PAYMENT_METHOD_DISPLAY.get(self.payment_method, self.payment_method)
+    
     def __str__(self):
-        return f"{self.get_payment_method_display()} - ${self.amount}"
+        return f"{self.payment_method_display} - ${self.amount}"
     
     class Meta:
         db_table = 'payments'
+
         
 ##
 class Supplier(models.Model):
@@ -354,22 +640,21 @@ class Supplier(models.Model):
         ordering = ['name']
 
 
+class StockMovementManager(BulkInsertManager):
+    """Always join the relations shown in movement listings and __str__"""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('product', 'supplier', 'user')
+
+
 class StockMovement(models.Model):
     """Track all stock movements (purchases, sales, adjustments)"""
-    MOVEMENT_TYPE_CHOICES = [
-        ('purchase', 'Purchase'),
-        ('sale', 'Sale'),
-        ('adjustment', 'Adjustment'),
-        ('return', 'Return'),
-        ('damage', 'Damage/Loss'),
-    ]
-    
     product = models.ForeignKey(
         'Product',
         on_delete=models.PROTECT,
         related_name='stock_movements'
     )
-    movement_type = models.CharField(max_length=20, choices=MOVEMENT_TYPE_CHOICES)
+    movement_type = models.CharField(max_length=20, choices=MovementType.choices)
     quantity = models.IntegerField(help_text="Positive for stock in, negative for stock out")
     previous_quantity = models.IntegerField()
     new_quantity = models.IntegerField()
@@ -404,6 +689,12 @@ class StockMovement(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = StockMovementManager()
+    
+    @property
+    def movement_type_display(self):
+        return _MOVEMENT_TYPE_DISPLAY.get(self.movement_type, self.movement_type)
+    
     def __str__(self):
         return f"{self.product.name} - {self.movement_type} - {self.quantity}"
     
@@ -413,18 +704,26 @@ class StockMovement(models.Model):
         indexes = [
             models.Index(fields=['product', '-created_at']),
             models.Index(fields=['movement_type', '-created_at']),
+            models.Index(fields=['sale', '-created_at']),
         ]
 
 
+_MOVEMENT_TYPE_DISPLAY = dict(MovementType.choices)
+
+
+class PurchaseOrderQuerySet(models.QuerySet):
+    def with_all(self):
+        """
+        Fetch everything a purchase order detail renders in a fixed number
+        of queries, including the product behind each item.
+        """
+        return self.select_related('supplier', 'created_by').prefetch_related(
+            Prefetch('items', queryset=PurchaseOrderItem.objects.select_related('product'))
+        )
+
+
 class PurchaseOrder(models.Model):
     """Purchase orders for restocking"""
-    STATUS_CHOICES = [
-        ('draft', 'Draft'),
-        ('pending', 'Pending'),
-        ('received', 'Received'),
-        ('cancelled', 'Cancelled'),
-    ]
-    
     po_number = models.CharField(max_length=50, unique=True, editable=False)
     supplier = models.ForeignKey(
         Supplier,
@@ -434,7 +733,7 @@ class PurchaseOrder(models.Model):
     order_date = models.DateTimeField(auto_now_add=True)
     expected_delivery_date = models.DateField(null=True, blank=True)
     received_date = models.DateTimeField(null=True, blank=True)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    status = models.CharField(max_length=20, choices=PurchaseOrderStatus.choices, default=PurchaseOrderStatus.DRAFT)
     subtotal = models.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -463,16 +762,20 @@ class PurchaseOrder(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PurchaseOrderQuerySet.as_manager()
+    
     def save(self, *args, **kwargs):
         if not self.po_number:
             # Generate unique PO number
-            import uuid
-            from django.utils import timezone
             date_str = timezone.now().strftime('%Y%m%d')
-            random_str = str(uuid.uuid4())[:6].upper()
+            random_str = f'{random.getrandbits(24):06X}'
             self.po_number = f'PO-{date_str}-{random_str}'
         super().save(*args, **kwargs)
     
+    @property
+    def status_display(self):
+        return _PO_STATUS_DISPLAY.get(self.status, self.status)
+    
     def __str__(self):
         return f"{self.po_number} - {self.supplier.name}"
     
@@ -481,6 +784,9 @@ class PurchaseOrder(models.Model):
         ordering = ['-created_at']
 
 
+_PO_STATUS_DISPLAY = dict(PurchaseOrderStatus.choices)
+
+
 class PurchaseOrderItem(models.Model):
     """Items in a purchase order"""
     purchase_order = models.ForeignKey(
@@ -500,16 +806,14 @@ class PurchaseOrderItem(models.Model):
         decimal_places=2,
         validators=[MinValueValidator(Decimal('0.01'))]
     )
-    subtotal = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        validators=[MinValueValidator(Decimal('0.00'))]
+    subtotal = models.GeneratedField(
+        expression=F('unit_cost') * F('quantity_ordered'),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
     
-    def save(self, *args, **kwargs):
-        self.subtotal = self.unit_cost * self.quantity_ordered
-        super().save(*args, **kwargs)
+    objects = BulkInsertManager()
     
     def __str__(self):
         return f"{self.product.name} x {self.quantity_ordered}"
@@ -534,6 +838,35 @@ class StockAlert(models.Model):
     def __str__(self):
         return f"{self.product.name} - Low Stock Alert"
     
+    @classmethod
+    def scan_and_create(cls):
+        """Open an alert for every low-stock product in one SELECT + one INSERT.
+        Products that already have an open alert are skipped by the
+        partial unique constraint."""
+        low = Product.objects.filter(
+            is_active=True,
+            stock_quantity__lte=F('min_stock_level')
+        ).values('id', 'stock_quantity', 'min_stock_level')
+        alerts = [
+            cls(
+                product_id=p['id'],
+                current_stock=p['stock_quantity'],
+                alert_level=p['min_stock_level']
+            )
+            for p in low
+        ]
+        created = cls.objects.bulk_create(alerts, ignore_conflicts=True, batch_size=1000)
+        # bulk_create sends no post_save for the stats receivers to see
+        transaction.on_commit(invalidate_stock_stats)
+        return created
+    
     class Meta:
         db_table = 'stock_alerts'
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['product'],
+                condition=Q(is_resolved=False),
+                name='stock_alerts_open_uniq'
+            ),
+        ]
\ No newline at end of file
@@ -1,25 +1,31 @@
 from rest_framework import permissions
 
+from .models import Role
+
+
+def _has_role(user, *names):
+    """Compare the denormalized role name, no role lookup needed"""
+    if not (user and user.is_authenticated):
+        return False
+    return user.role_name in names
+
+
 class IsAdmin(permissions.BasePermission):
     """Permission check for admin users"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.is_admin
+        return _has_role(request.user, Role.ADMIN)
 
 
 class IsManager(permissions.BasePermission):
     """Permission check for manager users"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and (
-            request.user.is_admin or request.user.is_manager
-        )
+        return _has_role(request.user, Role.ADMIN, Role.MANAGER)
 
 
 class IsCashier(permissions.BasePermission):
     """Permission check for cashier users"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and (
-            request.user.is_admin or request.user.is_manager or request.user.is_cashier
-        )
+        return _has_role(request.user, Role.ADMIN, Role.MANAGER, Role.CASHIER)
 
 
 class IsAdminOrReadOnly(permissions.BasePermission):
@@ -27,7 +33,7 @@ class IsAdminOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method in permissions.SAFE_METHODS:
             return request.user and request.user.is_authenticated
-        return request.user and request.user.is_authenticated and request.user.is_admin
+        return _has_role(request.user, Role.ADMIN)
     
 
 ##
\ No newline at end of file
@@ -1,13 +1,68 @@
-from rest_framework import serializers
+from collections import OrderedDict
+from rest_framework import permissions, serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, models, transaction
 from decimal import Decimal
 from .models import (
     User, Role, Supplier,
     Product, Category, StockMovement,
     Sale, SaleItem, Payment, StockAlert,
-    PurchaseOrder, PurchaseOrderItem
+    PurchaseOrder, PurchaseOrderItem, PaymentMethod
 )
 
+# Shared Decimal constants for the sale/PO total calculations
+_ZERO = Decimal('0.00')
+_CENT = Decimal('0.01')
+_VAT_RATE = Decimal('0.16')
+
+
+class DynamicFieldsMixin:
+    """
+    Limit output to a comma-separated `?fields=` list from the request.
+    Only reads are narrowed, so writes still validate every field.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return
+        fields = request.query_params.get('fields')
+        if fields:
+            allowed = set(fields.split(','))
+            for name in set(self.fields) - allowed:
+                self.fields.pop(name)
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    List serializer that resolves the child's readable fields once for the
+    whole list instead of once per row. Rows render exactly like
+    Serializer.to_representation(); use only for children that don't
+    override it.
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        fields = [
+            (field.field_name, field.get_attribute, field.to_representation)
+            for field in self.child._readable_fields
+        ]
+        rows = []
+        for instance in iterable:
+            row = OrderedDict()
+            for name, get_attribute, to_representation in fields:
+                try:
+                    attribute = get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                row[name] = None if check_for_none is None else to_representation(attribute)
+            rows.append(row)
+        return rows
+
 
 class RoleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -15,9 +70,10 @@ class RoleSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description']
 
 
-class UserSerializer(serializers.ModelSerializer):
-    role_name = serializers.CharField(source='role.name', read_only=True)
-    role_display = serializers.CharField(source='role.get_name_display', read_only=True)
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    # Read from the denormalized User.role_name, so no role join is needed
+    role_name = serializers.CharField(read_only=True)
+    role_display = serializers.CharField(read_only=True)
     
     class Meta:
         model = User
@@ -75,29 +131,28 @@ class ChangePasswordSerializer(serializers.Serializer):
     
 
 ##
-class CategorySerializer(serializers.ModelSerializer):
-    product_count = serializers.SerializerMethodField()
+class CategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    # Annotated by the views; a freshly created category has no products
+    product_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = Category
         fields = ['id', 'name', 'description', 'is_active', 'product_count', 'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
-    
-    def get_product_count(self, obj):
-        return obj.products.filter(is_active=True).count()
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+class ProductListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for product list view (less detailed)"""
     category_name = serializers.CharField(source='category.name', read_only=True)
     is_low_stock = serializers.BooleanField(read_only=True)
     
     class Meta:
         model = Product
-        fields = [
+        fields = (
             'id', 'name', 'sku', 'barcode', 'category', 'category_name',
             'price', 'stock_quantity', 'is_low_stock', 'is_active', 'image'
-        ]
+        )
+        list_serializer_class = FastListSerializer
 
 
 class ProductDetailSerializer(serializers.ModelSerializer):
@@ -131,29 +186,37 @@ class ProductCreateUpdateSerializer(serializers.ModelSerializer):
             'price', 'cost_price', 'tax_rate', 'stock_quantity',
             'min_stock_level', 'is_active', 'image'
         ]
+        # SKU and barcode uniqueness is enforced by the database, see _save_unique()
+        extra_kwargs = {'barcode': {'validators': []}}
     
-    def validate_sku(self, value):
-        """Ensure SKU is unique"""
-        instance = self.instance
-        if instance and instance.sku == value:
-            return value
-        
-        if Product.objects.filter(sku=value).exists():
-            raise serializers.ValidationError("Product with this SKU already exists.")
-        return value
+    def _save_unique(self, save, *args):
+        """Run a create/update, reporting a UNIQUE violation as a field error"""
+        try:
+            with transaction.atomic():
+                return save(*args)
+        except IntegrityError:
+            # Look up which value was taken; the error text varies by backend
+            validated_data = args[-1]
+            others = Product.objects.all()
+            if self.instance is not None:
+                others = others.exclude(pk=self.instance.pk)
+            barcode = validated_data.get('barcode')
+            if barcode and others.filter(barcode=barcode).exists():
+                raise serializers.ValidationError(
+                    {'barcode': "Product with this barcode already exists."}
+                )
+            sku = validated_data.get('sku')
+            if sku and others.filter(sku=sku).exists():
+                raise serializers.ValidationError(
+                    {'sku': "Product with this SKU already exists."}
+                )
+            raise
     
-    def validate_barcode(self, value):
-        """Ensure barcode is unique if provided"""
-        if not value:
-            return value
-        
-        instance = self.instance
-        if instance and instance.barcode == value:
-            return value
-        
-        if Product.objects.filter(barcode=value).exists():
-            raise serializers.ValidationError("Product with this barcode already exists.")
-        return value
+    def create(self, validated_data):
+        return self._save_unique(super().create, validated_data)
+    
+    def update(self, instance, validated_data):
+        return self._save_unique(super().update, instance, validated_data)
     
     def validate(self, attrs):
         """Additional validation"""
@@ -175,6 +238,8 @@ class BulkProductUploadSerializer(serializers.Serializer):
     
 ## 
 class SaleItemSerializer(serializers.ModelSerializer):
+    subtotal = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    
     class Meta:
         model = SaleItem
         fields = [
@@ -191,10 +256,10 @@ class PaymentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class SaleListSerializer(serializers.ModelSerializer):
+class SaleListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for sale list view"""
     cashier_name = serializers.CharField(source='cashier.username', read_only=True)
-    items_count = serializers.SerializerMethodField()
+    items_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Sale
@@ -203,9 +268,7 @@ class SaleListSerializer(serializers.ModelSerializer):
             'customer_name', 'total', 'payment_method', 'status',
             'items_count', 'created_at'
         ]
-    
-    def get_items_count(self, obj):
-        return obj.items.count()
+        list_serializer_class = FastListSerializer
 
 
 class SaleDetailSerializer(serializers.ModelSerializer):
@@ -242,8 +305,8 @@ class SaleCreateSerializer(serializers.Serializer):
     customer_name = serializers.CharField(required=False, allow_blank=True)
     items = SaleItemCreateSerializer(many=True)
     payment_method = serializers.ChoiceField(
-        choices=['cash', 'card', 'mobile'],
-        default='cash'
+        choices=PaymentMethod.choices,
+        default=PaymentMethod.CASH
     )
     amount_paid = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
     notes = serializers.CharField(required=False, allow_blank=True)
@@ -256,14 +319,18 @@ class SaleCreateSerializer(serializers.Serializer):
     def validate(self, attrs):    
     # Calculate totals
         items_data = attrs.get('items', [])
-        subtotal = Decimal('0.00')
-        tax_amount = Decimal('0.00')
-        discount_amount = Decimal('0.00')
+        subtotal = _ZERO
+        tax_amount = _ZERO
+        discount_amount = _ZERO
+        
+        # Fetch every product in the cart with one query
+        product_ids = [item_data['product_id'] for item_data in items_data]
+        products = Product.objects.in_bulk(product_ids)
+        per_item = []
         
         for item_data in items_data:
-            try:
-                product = Product.objects.get(id=item_data['product_id'])
-            except Product.DoesNotExist:
+            product = products.get(item_data['product_id'])
+            if product is None:
                 raise serializers.ValidationError(
                     f"Product with id {item_data['product_id']} not found."
                 )
@@ -274,29 +341,38 @@ class SaleCreateSerializer(serializers.Serializer):
                     f"Insufficient stock for {product.name}. Available: {product.stock_quantity}"
                 )
             
-            # Calculate amounts with proper Decimal precision
-            quantity = Decimal(str(item_data['quantity']))
-            unit_price = Decimal(str(product.price))
-            discount_percent = Decimal(str(item_data.get('discount_percent', 0)))
-            tax_rate = Decimal(str(product.tax_rate))
+            # Prices and rates are already Decimals; quantity stays an int
+            quantity = item_data['quantity']
+            unit_price = product.price
+            discount_percent = item_data.get('discount_percent', 0)
+            tax_rate = product.tax_rate
             
-            # Calculate step by step
+            # Calculate step by step; scaleb(-2) is an exact /100 without a division
             item_subtotal = unit_price * quantity
-            item_discount = item_subtotal * (discount_percent / Decimal('100'))
+            item_discount = (item_subtotal * discount_percent).scaleb(-2)
             item_after_discount = item_subtotal - item_discount
-            item_tax = item_after_discount * (tax_rate / Decimal('100'))
+            item_tax = (item_after_discount * tax_rate).scaleb(-2)
             
             subtotal += item_subtotal
             discount_amount += item_discount
             tax_amount += item_tax
+            
+            # Priced lines are reused by create() so the sale items match these totals
+            per_item.append({
+                'product_id': product.id,
+                'quantity': item_data['quantity'],
+                'unit_price': unit_price,
+                'tax_rate': tax_rate,
+                'discount_percent': discount_percent,
+            })
         
         total = subtotal - discount_amount + tax_amount
         
         # Round to 2 decimal places
-        total = total.quantize(Decimal('0.01'))
+        total = total.quantize(_CENT)
         
-        # Validate payment amount - also use Decimal
-        amount_paid = Decimal(str(attrs['amount_paid']))
+        # Validate payment amount
+        amount_paid = attrs['amount_paid']
         
         if amount_paid < total:
             raise serializers.ValidationError(
@@ -305,11 +381,12 @@ class SaleCreateSerializer(serializers.Serializer):
         
         # Store calculated values
         attrs['_calculated'] = {
-            'subtotal': subtotal.quantize(Decimal('0.01')),
-            'tax_amount': tax_amount.quantize(Decimal('0.01')),
-            'discount_amount': discount_amount.quantize(Decimal('0.01')),
+            'subtotal': subtotal.quantize(_CENT),
+            'tax_amount': tax_amount.quantize(_CENT),
+            'discount_amount': discount_amount.quantize(_CENT),
             'total': total,
-            'change_amount': (amount_paid - total).quantize(Decimal('0.01'))
+            'change_amount': (amount_paid - total).quantize(_CENT),
+            'items': per_item,
         }
     
         return attrs
@@ -317,12 +394,17 @@ class SaleCreateSerializer(serializers.Serializer):
     def create(self, validated_data):
         from django.db import transaction
         
-        items_data = validated_data.pop('items')
+        validated_data.pop('items')
         calculated = validated_data.pop('_calculated')
         
+        # Numbered in its own short transaction, so concurrent checkouts
+        # don't queue on the day's counter row until this one commits
+        invoice_number = Sale.next_invoice_number()
+        
         with transaction.atomic():
             # Create sale
             sale = Sale.objects.create(
+                invoice_number=invoice_number,
                 cashier=self.context['request'].user,
                 customer_name=validated_data.get('customer_name', ''),
                 subtotal=calculated['subtotal'],
@@ -336,44 +418,19 @@ class SaleCreateSerializer(serializers.Serializer):
                 status='completed'
             )
             
-            # Create sale items and update stock
-            for item_data in items_data:
-                product = Product.objects.select_for_update().get(id=item_data['product_id'])
-                
-                # Create sale item
-                SaleItem.objects.create(
-                    sale=sale,
-                    product=product,
-                    product_name=product.name,
-                    product_sku=product.sku,
-                    quantity=item_data['quantity'],
-                    unit_price=product.price,
-                    tax_rate=product.tax_rate,
-                    discount_percent=item_data.get('discount_percent', 0)
-                )
-                
-                # Update stock
-                product.stock_quantity -= item_data['quantity']
-                product.save()
-                
-                ## Check this ##
-                StockMovement.objects.create(
-                    product=product,
-                    movement_type='sale',
-                    quantity=-item_data['quantity'],
-                    previous_quantity=product.stock_quantity + item_data['quantity'],
-                    new_quantity=product.stock_quantity,
-                    sale=sale,
-                    user=self.context['request'].user
-                )
+            # Create sale items and update stock in batched statements
+            sale_items = Sale.finalize(sale, calculated['items'], user=self.context['request'].user)
             
             # Create payment record
-            Payment.objects.create(
+            payment = Payment.objects.create(
                 sale=sale,
                 payment_method=validated_data['payment_method'],
                 amount=validated_data['amount_paid']
             )
         
+        # The rows just written (generated subtotals included, via RETURNING)
+        # serve the receipt as if prefetched, instead of being read back
+        sale._prefetched_objects_cache = {'items': sale_items, 'payments': [payment]}
         return sale
     
 ## 
@@ -387,12 +444,12 @@ class SupplierSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class StockMovementSerializer(serializers.ModelSerializer):
+class StockMovementSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     product_name = serializers.CharField(source='product.name', read_only=True)
     product_sku = serializers.CharField(source='product.sku', read_only=True)
     supplier_name = serializers.CharField(source='supplier.name', read_only=True)
     user_name = serializers.CharField(source='user.username', read_only=True)
-    movement_type_display = serializers.CharField(source='get_movement_type_display', read_only=True)
+    movement_type_display = serializers.CharField(read_only=True)
     
     class Meta:
         model = StockMovement
@@ -404,6 +461,7 @@ class StockMovementSerializer(serializers.ModelSerializer):
             'sale', 'user', 'user_name', 'notes', 'created_at'
         ]
         read_only_fields = ['created_at']
+        list_serializer_class = FastListSerializer
 
 
 class StockAdjustmentSerializer(serializers.Serializer):
@@ -435,6 +493,7 @@ class StockAdjustmentSerializer(serializers.Serializer):
 class PurchaseOrderItemSerializer(serializers.ModelSerializer):
     product_name = serializers.CharField(source='product.name', read_only=True)
     product_sku = serializers.CharField(source='product.sku', read_only=True)
+    subtotal = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
     
     class Meta:
         model = PurchaseOrderItem
@@ -445,11 +504,11 @@ class PurchaseOrderItemSerializer(serializers.ModelSerializer):
         read_only_fields = ['subtotal']
 
 
-class PurchaseOrderListSerializer(serializers.ModelSerializer):
+class PurchaseOrderListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     supplier_name = serializers.CharField(source='supplier.name', read_only=True)
     created_by_name = serializers.CharField(source='created_by.username', read_only=True)
-    items_count = serializers.SerializerMethodField()
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    items_count = serializers.IntegerField(read_only=True)
+    status_display = serializers.CharField(read_only=True)
     
     class Meta:
         model = PurchaseOrder
@@ -458,16 +517,14 @@ class PurchaseOrderListSerializer(serializers.ModelSerializer):
             'order_date', 'expected_delivery_date', 'status', 'status_display',
             'total', 'items_count', 'created_by_name', 'created_at'
         ]
-    
-    def get_items_count(self, obj):
-        return obj.items.count()
+        list_serializer_class = FastListSerializer
 
 
 class PurchaseOrderDetailSerializer(serializers.ModelSerializer):
     supplier_name = serializers.CharField(source='supplier.name', read_only=True)
     created_by_name = serializers.CharField(source='created_by.username', read_only=True)
     items = PurchaseOrderItemSerializer(many=True, read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    status_display = serializers.CharField(read_only=True)
     
     class Meta:
         model = PurchaseOrder
@@ -487,9 +544,7 @@ class PurchaseOrderCreateSerializer(serializers.Serializer):
     notes = serializers.CharField(required=False, allow_blank=True)
     
     def validate_supplier_id(self, value):
-        try:
-            Supplier.objects.get(id=value)
-        except Supplier.DoesNotExist:
+        if not Supplier.objects.filter(id=value).exists():
             raise serializers.ValidationError(f"Supplier with id {value} not found.")
         return value
     
@@ -503,14 +558,44 @@ class PurchaseOrderCreateSerializer(serializers.Serializer):
                     "Each item must have product_id, quantity, and unit_cost."
                 )
         
+        # Check every product exists with one query, keeping what the PO renders
+        product_ids = {item['product_id'] for item in value}
+        found = {
+            str(product.pk): product
+            for product in Product.objects.filter(id__in=product_ids).only('id', 'name', 'sku')
+        }
+        for item in value:
+            # Items are plain dicts, so ids may arrive as strings
+            product = found.get(str(item['product_id']))
+            if product is None:
+                raise serializers.ValidationError(f"Product with id {item['product_id']} not found.")
+            item['_product'] = product
+        
         return value
     
     def create(self, validated_data):
         from django.db import transaction
-        from decimal import Decimal
         
         items_data = validated_data.pop('items')
         
+        # Build the items and totals first so the PO is inserted complete
+        subtotal = _ZERO
+        items = []
+        
+        for item_data in items_data:
+            quantity = int(item_data['quantity'])
+            unit_cost = Decimal(str(item_data['unit_cost']))
+            
+            items.append(PurchaseOrderItem(
+                product=item_data['_product'],
+                quantity_ordered=quantity,
+                unit_cost=unit_cost
+            ))
+            
+            subtotal += unit_cost * quantity
+        
+        tax_amount = subtotal * _VAT_RATE  # 16% tax
+        
         with transaction.atomic():
             # Create purchase order
             po = PurchaseOrder.objects.create(
@@ -518,32 +603,18 @@ class PurchaseOrderCreateSerializer(serializers.Serializer):
                 expected_delivery_date=validated_data.get('expected_delivery_date'),
                 notes=validated_data.get('notes', ''),
                 created_by=self.context['request'].user,
-                status='pending'
+                status='pending',
+                subtotal=subtotal,
+                tax_amount=tax_amount,
+                total=subtotal + tax_amount
             )
             
-            # Create items and calculate totals
-            subtotal = Decimal('0.00')
-            
-            for item_data in items_data:
-                product = Product.objects.get(id=item_data['product_id'])
-                quantity = int(item_data['quantity'])
-                unit_cost = Decimal(str(item_data['unit_cost']))
-                
-                PurchaseOrderItem.objects.create(
-                    purchase_order=po,
-                    product=product,
-                    quantity_ordered=quantity,
-                    unit_cost=unit_cost
-                )
-                
-                subtotal += unit_cost * quantity
-            
-            # Update PO totals
-            po.subtotal = subtotal
-            po.tax_amount = subtotal * Decimal('0.16')  # 16% tax
-            po.total = po.subtotal + po.tax_amount
-            po.save()
+            for item in items:
+                item.purchase_order = po
+            PurchaseOrderItem.objects.bulk_insert(items, batch_size=500)
         
+        # Render the response from these rows rather than reading them back
+        po._prefetched_objects_cache = {'items': items}
         return po
 
 
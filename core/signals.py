@@ -0,0 +1,47 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from .cache import (
+    CATEGORY_LIST_KEY, ROLE_LIST_KEY, invalidate, invalidate_stats, invalidate_stock_stats,
+)
+from .models import Category, Product, PurchaseOrder, Role, Sale, StockAlert
+
+
+@receiver(pre_delete, sender=Role)
+def clear_user_role_name(sender, instance, **kwargs):
+    """Users fall back to no role when their role is deleted"""
+    instance.users.update(role_name='')
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def invalidate_role_cache(sender, **kwargs):
+    """Drop the cached role list whenever roles change"""
+    invalidate(ROLE_LIST_KEY)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_category_list(sender, **kwargs):
+    """The category list carries active product counts"""
+    invalidate(CATEGORY_LIST_KEY)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=PurchaseOrder)
+@receiver(post_save, sender=StockAlert)
+def stock_stats_changed(sender, **kwargs):
+    """Wait for the commit so other requests can't re-cache the old figures"""
+    transaction.on_commit(invalidate_stock_stats)
+
+
+@receiver(post_save, sender=Sale)
+@receiver(post_delete, sender=Sale)
+def invalidate_sale_stats(sender, **kwargs):
+    """Sales move stock too, through bulk updates that send no signals"""
+    transaction.on_commit(invalidate_stats)
@@ -1,3 +1,368 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import (
+    Category, InvoiceCounter, Product, PurchaseOrder, Role, Sale, SaleItem,
+    StockMovement, Supplier, User,
+)
+
+
+class POSTestCase(TestCase):
+    """Roles, a manager and a few products, with an authenticated client"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_role = Role.objects.create(name=Role.ADMIN)
+        cls.manager_role = Role.objects.create(name=Role.MANAGER)
+        cls.cashier_role = Role.objects.create(name=Role.CASHIER)
+        cls.manager = User.objects.create_user(
+            username='manager', password='pass', role=cls.manager_role
+        )
+        cls.pen = Product.objects.create(
+            name='Pen', sku='PEN-1', price=Decimal('2.50'), cost_price=Decimal('1.00'),
+            tax_rate=Decimal('10.00'), stock_quantity=20
+        )
+        cls.book = Product.objects.create(
+            name='Book', sku='BOOK-1', price=Decimal('12.00'), cost_price=Decimal('7.00'),
+            stock_quantity=5
+        )
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+    
+    def create_sale(self, items, amount_paid='1000'):
+        response = self.client.post('/api/sales/create/', {
+            'items': items,
+            'payment_method': 'cash',
+            'amount_paid': amount_paid,
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return Sale.objects.get(pk=response.data['id'])
+    
+    def stock(self, product):
+        return Product.objects.values_list('stock_quantity', flat=True).get(pk=product.pk)
+
+
+class SaleFinalizeTests(POSTestCase):
+
+    def test_finalize_writes_items_movements_and_stock(self):
+        sale = Sale.objects.create(
+            cashier=self.manager, subtotal=0, total=0, amount_paid=0
+        )
+        items = Sale.finalize(sale, [
+            {'product_id': self.pen.pk, 'quantity': 3, 'discount_percent': Decimal('10')},
+            {'product_id': self.book.pk, 'quantity': 1},
+            {'product_id': self.pen.pk, 'quantity': 2},
+        ], user=self.manager)
+        
+        self.assertEqual(self.stock(self.pen), 15)
+        self.assertEqual(self.stock(self.book), 4)
+        
+        # Repeated lines for one product chain their movements
+        movements = list(
+            StockMovement.objects.filter(sale=sale, product=self.pen)
+            .order_by('id').values_list('quantity', 'previous_quantity', 'new_quantity')
+        )
+        self.assertEqual(movements, [(-3, 20, 17), (-2, 17, 15)])
+        
+        # Subtotals are generated by the database and come back on the instances
+        self.assertEqual(
+            [item.subtotal for item in items],
+            [Decimal('7.43'), Decimal('12.00'), Decimal('5.50')]
+        )
+        self.assertEqual(
+            sorted(SaleItem.objects.filter(sale=sale).values_list('subtotal', flat=True)),
+            sorted(item.subtotal for item in items)
+        )
+    
+    def test_sale_endpoint_matches_stored_sale(self):
+        sale = self.create_sale([
+            {'product_id': self.pen.pk, 'quantity': 4},
+            {'product_id': self.book.pk, 'quantity': 2},
+        ])
+        
+        self.assertEqual(self.stock(self.pen), 16)
+        self.assertEqual(self.stock(self.book), 3)
+        self.assertEqual(sale.items.count(), 2)
+        self.assertEqual(sale.total, Decimal('35.00'))
+        self.assertEqual(StockMovement.objects.filter(sale=sale, movement_type='sale').count(), 2)
+    
+    def test_sale_over_stock_is_rejected(self):
+        response = self.client.post('/api/sales/create/', {
+            'items': [{'product_id': self.book.pk, 'quantity': 6}],
+            'amount_paid': '1000',
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.stock(self.book), 5)
+        self.assertFalse(Sale.objects.exists())
+
+
+class InvoiceCounterTests(POSTestCase):
+
+    def test_allocate_reserves_consecutive_numbers(self):
+        today = timezone.localdate()
+        self.assertEqual(InvoiceCounter.allocate(today), 1)
+        self.assertEqual(InvoiceCounter.allocate(today, count=3), 2)
+        self.assertEqual(InvoiceCounter.allocate(today), 5)
+        self.assertEqual(InvoiceCounter.objects.get(date=today).seq, 5)
+    
+    def test_sales_get_unique_sequential_invoice_numbers(self):
+        today = timezone.localdate()
+        sales = [self.create_sale([{'product_id': self.pen.pk, 'quantity': 1}]) for _ in range(3)]
+        sales += Sale.objects.bulk_create_with_invoices([
+            Sale(cashier=self.manager, subtotal=0, total=0, amount_paid=0)
+            for _ in range(2)
+        ])
+        
+        self.assertEqual(
+            [sale.invoice_number for sale in sales],
+            [f'INV-{today:%Y%m%d}-{seq:06d}' for seq in range(1, 6)]
+        )
+    
+    def test_checkout_numbers_the_sale_before_its_transaction(self):
+        # The counter update commits on its own, so a failed checkout
+        # doesn't hold (or roll back) the day's counter row
+        with mock.patch.object(Sale, 'finalize', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.create_sale([{'product_id': self.pen.pk, 'quantity': 1}])
+        
+        self.assertFalse(Sale.objects.exists())
+        self.assertEqual(InvoiceCounter.objects.get(date=timezone.localdate()).seq, 1)
+    
+    def test_numbering_restarts_each_day(self):
+        today = timezone.localdate()
+        InvoiceCounter.allocate(today, count=7)
+        self.assertEqual(InvoiceCounter.allocate(today - timedelta(days=1)), 1)
+
+
+class ConditionalTransitionTests(POSTestCase):
+
+    def test_cancel_restocks_once(self):
+        sale = self.create_sale([
+            {'product_id': self.pen.pk, 'quantity': 2},
+            {'product_id': self.pen.pk, 'quantity': 3},
+        ])
+        self.assertEqual(self.stock(self.pen), 15)
+        
+        first = self.client.post(f'/api/sales/{sale.pk}/cancel/')
+        second = self.client.post(f'/api/sales/{sale.pk}/cancel/')
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 400)
+        self.assertEqual(self.stock(self.pen), 20)
+    
+    def test_cancel_that_loses_the_race_does_not_restock(self):
+        sale = self.create_sale([{'product_id': self.pen.pk, 'quantity': 2}])
+        # Another request cancels the sale after this one has read it
+        stale = Sale.objects.with_all().get(pk=sale.pk)
+        Sale.objects.filter(pk=sale.pk).update(status='cancelled')
+        
+        with mock.patch.object(Sale.objects, 'with_all') as with_all:
+            with_all.return_value.get.return_value = stale
+            response = self.client.post(f'/api/sales/{sale.pk}/cancel/')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.stock(self.pen), 18)
+    
+    def test_receive_adds_stock_once(self):
+        supplier = Supplier.objects.create(name='Acme')
+        response = self.client.post('/api/inventory/purchase-orders/create/', {
+            'supplier_id': supplier.pk,
+            'items': [
+                {'product_id': self.book.pk, 'quantity': 4, 'unit_cost': '6.00'},
+                {'product_id': self.book.pk, 'quantity': 1, 'unit_cost': '6.00'},
+            ],
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        po = PurchaseOrder.objects.get(pk=response.data['id'])
+        
+        first = self.client.post(f'/api/inventory/purchase-orders/{po.pk}/receive/')
+        second = self.client.post(f'/api/inventory/purchase-orders/{po.pk}/receive/')
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 400)
+        self.assertEqual(self.stock(self.book), 10)
+        self.assertEqual(
+            list(StockMovement.objects.filter(reference_number=po.po_number)
+                 .order_by('id').values_list('previous_quantity', 'new_quantity')),
+            [(5, 9), (9, 10)]
+        )
+        self.assertEqual(
+            self.client.post(f'/api/inventory/purchase-orders/{po.pk}/cancel/').status_code, 400
+        )
+
+
+class RoleNameTests(POSTestCase):
+
+    def test_role_name_follows_the_users_role(self):
+        user = User.objects.create_user(username='cashier', password='pass', role=self.cashier_role)
+        self.assertEqual(User.objects.get(pk=user.pk).role_name, Role.CASHIER)
+        
+        user.role = self.admin_role
+        user.save(update_fields=['role'])
+        self.assertEqual(User.objects.get(pk=user.pk).role_name, Role.ADMIN)
+        self.assertTrue(User.objects.get(pk=user.pk).is_admin)
+        
+        user.role = None
+        user.save()
+        self.assertEqual(User.objects.get(pk=user.pk).role_name, '')
+    
+    def test_partial_saves_keep_role_name(self):
+        user = User.objects.create_user(username='cashier', password='pass', role=self.cashier_role)
+        user.set_password('other')
+        user.save(update_fields=['password'])
+        self.assertEqual(User.objects.get(pk=user.pk).role_name, Role.CASHIER)
+    
+    def test_renaming_or_deleting_a_role_updates_its_users(self):
+        user = User.objects.create_user(username='cashier', password='pass', role=self.cashier_role)
+        
+        self.admin_role.delete()
+        self.cashier_role.name = Role.ADMIN
+        self.cashier_role.save()
+        self.assertEqual(User.objects.get(pk=user.pk).role_name, Role.ADMIN)
+        
+        self.cashier_role.delete()
+        user = User.objects.get(pk=user.pk)
+        self.assertIsNone(user.role_id)
+        self.assertEqual(user.role_name, '')
+
+
+class BulkProductUploadTests(POSTestCase):
+
+    def upload(self, content):
+        csv_file = SimpleUploadedFile('products.csv', content.encode(), content_type='text/csv')
+        response = self.client.post('/api/products/bulk-upload/', {'csv_file': csv_file}, format='multipart')
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data
+    
+    def test_bad_rows_are_reported_and_good_rows_created(self):
+        data = self.upload(
+            'name,sku,price,cost_price,barcode\n'
+            'Ruler,RUL-1,3,,\n'
+            'Short,SHORT-1\n'
+            ',NONAME-1,4,1,\n'
+            'Glue,GLUE-1,cheap,1,\n'
+            'Tape,PEN-1,2,1,\n'
+            'Clip,CLIP-1,1,,777\n'
+            'Pin,PIN-1,1,,777\n'
+        )
+        
+        self.assertEqual(data['created_count'], 2)
+        self.assertEqual(len(data['errors']), 5)
+        for row_num, error in zip([3, 4, 5, 6, 8], data['errors']):
+            self.assertTrue(error.startswith(f'Row {row_num}: '), error)
+        self.assertIn('price', data['errors'][0])
+        self.assertIn('name', data['errors'][1])
+        self.assertIn('PEN-1', data['errors'][3])
+        self.assertEqual(
+            set(Product.objects.filter(sku__in=['RUL-1', 'CLIP-1']).values_list('sku', flat=True)),
+            {'RUL-1', 'CLIP-1'}
+        )
+        self.assertEqual(Product.objects.get(sku='RUL-1').cost_price, 0)
+    
+    def test_insert_failure_only_fails_the_conflicting_rows(self):
+        bulk_create = type(Product.objects).bulk_create
+        
+        def racing_bulk_create(manager, objs, *args, **kwargs):
+            # Another upload takes SKU RACE-2 after the existence checks ran
+            if any(obj.sku == 'RACE-2' for obj in objs):
+                raise IntegrityError('UNIQUE constraint failed: products.sku')
+            return bulk_create(manager, objs, *args, **kwargs)
+        
+        with mock.patch.object(type(Product.objects), 'bulk_create', racing_bulk_create):
+            data = self.upload(
+                'name,sku,price\n'
+                'One,RACE-1,1\n'
+                'Two,RACE-2,1\n'
+                'Three,RACE-3,1\n'
+            )
+        
+        self.assertEqual(data['created_count'], 2)
+        self.assertEqual(data['errors'], ['Row 3: UNIQUE constraint failed: products.sku'])
+        self.assertEqual(
+            set(Product.objects.filter(sku__startswith='RACE').values_list('sku', flat=True)),
+            {'RACE-1', 'RACE-3'}
+        )
+
+
+class ProductPerformanceReportTests(POSTestCase):
+    
+    def test_profit_and_margin_are_decimal_and_never_null(self):
+        self.create_sale([
+            {'product_id': self.book.pk, 'quantity': 2},
+            {'product_id': self.pen.pk, 'quantity': 1, 'discount_percent': '100'},
+        ])
+        
+        rows = {
+            row['product__sku']: row
+            for row in self.client.get('/api/reports/products/').data['top_products_by_quantity']
+        }
+        
+        self.assertEqual(rows['BOOK-1']['total_cost'], Decimal('14.00'))
+        self.assertEqual(rows['BOOK-1']['profit'], Decimal('10.00'))
+        self.assertEqual(rows['BOOK-1']['profit_margin'], Decimal('41.67'))
+        # Fully discounted, so there's cost but no revenue to take a margin of
+        self.assertEqual(rows['PEN-1']['profit'], Decimal('-1.00'))
+        self.assertEqual(rows['PEN-1']['profit_margin'], Decimal('0'))
+
+
+class DynamicFieldsTests(POSTestCase):
+    
+    def test_fields_narrows_user_category_and_movement_output(self):
+        self.create_sale([{'product_id': self.pen.pk, 'quantity': 1}])
+        Category.objects.create(name='Stationery')
+        
+        for url in ['/api/users/', '/api/categories/', '/api/inventory/stock-movements/']:
+            response = self.client.get(url, {'fields': 'id'})
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.data, url)
+            self.assertEqual({tuple(row) for row in response.data}, {('id',)}, url)
+        self.assertEqual(
+            set(self.client.get('/api/users/me/', {'fields': 'id,role_name'}).data),
+            {'id', 'role_name'}
+        )
+    
+    def test_fields_does_not_narrow_writes_or_the_cached_list(self):
+        response = self.client.post('/api/categories/?fields=id', {'name': 'Stationery'})
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertIn('name', response.data)
+        
+        self.assertEqual(len(self.client.get('/api/categories/', {'fields': 'id'}).data[0]), 1)
+        self.assertIn('name', self.client.get('/api/categories/').data[0])
+
 
-# Create your tests here.
+class ProductUniqueFieldTests(POSTestCase):
+    
+    def test_taken_sku_or_barcode_is_a_field_error(self):
+        Product.objects.filter(pk=self.book.pk).update(barcode='4006381333931')
+        new = {'name': 'Marker', 'price': '3.00', 'cost_price': '1.00'}
+        
+        response = self.client.post('/api/products/create/', {**new, 'sku': 'PEN-1'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data), {'sku'})
+        
+        response = self.client.post('/api/products/create/', {**new, 'barcode': '4006381333931'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data), {'barcode'})
+        
+        response = self.client.patch(f'/api/products/{self.pen.pk}/', {'barcode': '4006381333931'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data), {'barcode'})
+    
+    def test_keeping_its_own_sku_and_barcode_is_not_a_conflict(self):
+        Product.objects.filter(pk=self.book.pk).update(barcode='4006381333931')
+        
+        response = self.client.patch(
+            f'/api/products/{self.book.pk}/',
+            {'sku': 'BOOK-1', 'barcode': '4006381333931', 'price': '13.00'}
+        )
+        self.assertEqual(response.status_code, 200, response.data)
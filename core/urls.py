@@ -51,8 +51,14 @@ from .views import (
 )
 
 urlpatterns = [
-    # Authentication
+    # Hottest routes first: the resolver tries patterns in order
+    path('sales/create/', SaleCreateView.as_view(), name='sale_create'),
+    path('products/', ProductListView.as_view(), name='product_list'),
+    path('products/search/', ProductSearchView.as_view(), name='product_search'),
+    path('sales/', SaleListView.as_view(), name='sale_list'),
     path('auth/login/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
+    
+    # Authentication
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('auth/logout/', logout_view, name='logout'),
     path('auth/change-password/', ChangePasswordView.as_view(), name='change_password'),
@@ -71,17 +77,13 @@ urlpatterns = [
     path('categories/<int:pk>/', CategoryDetailView.as_view(), name='category_detail'),
     
     # Products
-    path('products/', ProductListView.as_view(), name='product_list'),
     path('products/create/', ProductCreateView.as_view(), name='product_create'),
-    path('products/search/', ProductSearchView.as_view(), name='product_search'),
     path('products/low-stock/', LowStockProductsView.as_view(), name='low_stock_products'),
     path('products/bulk-upload/', BulkProductUploadView.as_view(), name='bulk_upload'),
     path('products/stats/', product_stats_view, name='product_stats'),
     path('products/<int:pk>/', ProductDetailView.as_view(), name='product_detail'),
     
     # Sales
-    path('sales/', SaleListView.as_view(), name='sale_list'),
-    path('sales/create/', SaleCreateView.as_view(), name='sale_create'),
     path('sales/stats/', sales_stats_view, name='sales_stats'),
     path('sales/top-products/', top_selling_products_view, name='top_products'),
     path('sales/<int:pk>/', SaleDetailView.as_view(), name='sale_detail'),
@@ -1,5 +1,7 @@
 import random
-import uuid
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
 
 def generate_barcode_number():
     """Generate a 13-digit EAN-style barcode number"""
@@ -8,5 +10,11 @@ def generate_barcode_number():
 def generate_sku(name):
     """Generate a short human-readable SKU from product name"""
     prefix = name[:3].upper() if name else "SKU"
-    suffix = uuid.uuid4().hex[:4].upper()
-    return f"{prefix}-{suffix}"
\ No newline at end of file
+    suffix = f'{random.getrandbits(16):04X}'
+    return f"{prefix}-{suffix}"
+
+def day_start(value, days=0):
+    """Aware midnight opening the day `value` (a date or YYYY-MM-DD), shifted by `days`"""
+    day = value if isinstance(value, date) else date.fromisoformat(value)
+    day += timedelta(days=days)
+    return timezone.make_aware(datetime.combine(day, time.min))
@@ -1,20 +1,21 @@
 from rest_framework import status, generics, permissions, filters
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import update_session_auth_hash
-from django.db import transaction
-from django.db.models import Q, Sum, Count, Avg, F
-from django.db.models.functions import TruncDate, TruncMonth, TruncWeek
+from django.db import DataError, IntegrityError, connection, transaction
+from django.db.models import Q, Sum, Count, Avg, F, Case, When, Value, CharField, DecimalField, Func
+from django.db.models.functions import Coalesce, NullIf, Round, TruncDate, TruncMonth, TruncWeek
 from django.utils import timezone
 from .models import (
     User, Role, Product, Category,
-    Sale, SaleItem, Payment, Supplier,
+    Sale, SaleItem, DailyProductSales, Payment, Supplier,
     StockMovement, PurchaseOrder, PurchaseOrderItem,
-    StockAlert,
+    StockAlert, _PAYMENT_METHOD_DISPLAY,
 )
 from .serializers import (
     UserSerializer, UserCreateSerializer, UserUpdateSerializer,
@@ -28,12 +29,19 @@ from .serializers import (
     PurchaseOrderListSerializer, StockAlertSerializer
 )
 from .permissions import IsAdmin, IsManager, IsCashier
+from .cache import (
+    CATEGORY_LIST_KEY, DASHBOARD_STATS_KEY, INVENTORY_STATS_KEY, LIST_CACHE_TIMEOUT,
+    PRODUCT_STATS_KEY, ROLE_LIST_KEY, STATS_CACHE_TIMEOUT, invalidate, invalidate_stats,
+    inventory_report_key, sales_stats_key,
+)
+from django.core.cache import cache
 import io
 import uuid
 import csv
-from datetime import datetime, timedelta
+import tempfile
+from datetime import timedelta
 from decimal import Decimal
-from .utils import generate_barcode_number, generate_sku
+from .utils import day_start, generate_barcode_number, generate_sku
 
 
 
@@ -51,8 +59,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             'email': self.user.email,
             'first_name': self.user.first_name,
             'last_name': self.user.last_name,
-            'role': self.user.role.name if self.user.role else None,
-            'role_display': self.user.role.get_name_display() if self.user.role else None,
+            'role': self.user.role_name or None,
+            'role_display': self.user.role_display if self.user.role_name else None,
         }
         
         return data
@@ -71,7 +79,8 @@ class RegisterView(generics.CreateAPIView):
 
 class UserListView(generics.ListAPIView):
     """List all users (Admin and Manager)"""
-    queryset = User.objects.all().select_related('role')
+    # UserSerializer reads the denormalized role_name, so skip the default role join
+    queryset = User.objects.select_related(None)
     serializer_class = UserSerializer
     permission_classes = [IsManager]
 
@@ -98,7 +107,9 @@ class CurrentUserView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request):
-        serializer = UserSerializer(request.user)
+        # request.user only carries the auth columns; load the full profile
+        user = User.objects.get(pk=request.user.pk)
+        serializer = UserSerializer(user, context={'request': request})
         return Response(serializer.data)
 
 
@@ -121,10 +132,12 @@ class ChangePasswordView(APIView):
             
             # Set new password
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             
-            # Update session
-            update_session_auth_hash(request, user)
+            # Keep a browser session (e.g. the admin) signed in; token
+            # clients have none, and cycling one would just create it
+            if request.session.session_key:
+                update_session_auth_hash(request, user)
             
             return Response(
                 {'message': 'Password changed successfully.'},
@@ -134,8 +147,24 @@ class ChangePasswordView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RoleListView(generics.ListAPIView):
+class CachedListMixin:
+    """Serve list() from the cache; signals drop the key when the data changes"""
+    cache_key = None
+    
+    def list(self, request, *args, **kwargs):
+        # Only the full list is cached; ?fields= subsets are served live
+        if 'fields' in request.query_params:
+            return super().list(request, *args, **kwargs)
+        data = cache.get(self.cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(self.cache_key, data, LIST_CACHE_TIMEOUT)
+        return Response(data)
+
+
+class RoleListView(CachedListMixin, generics.ListAPIView):
     """List all roles"""
+    cache_key = ROLE_LIST_KEY
     queryset = Role.objects.all()
     serializer_class = RoleSerializer
     permission_classes = [IsAdmin]
@@ -152,9 +181,12 @@ def logout_view(request):
     
 
 ##
-class CategoryListCreateView(generics.ListCreateAPIView):
+class CategoryListCreateView(CachedListMixin, generics.ListCreateAPIView):
     """List all categories or create new one (Admin/Manager can create)"""
-    queryset = Category.objects.all()
+    cache_key = CATEGORY_LIST_KEY
+    queryset = Category.objects.annotate(
+        product_count=Count('products', filter=Q(products__is_active=True))
+    )
     serializer_class = CategorySerializer
     
     def get_permissions(self):
@@ -165,7 +197,9 @@ class CategoryListCreateView(generics.ListCreateAPIView):
 
 class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update or delete a category (Admin/Manager only for modifications)"""
-    queryset = Category.objects.all()
+    queryset = Category.objects.annotate(
+        product_count=Count('products', filter=Q(products__is_active=True))
+    )
     serializer_class = CategorySerializer
     
     def get_permissions(self):
@@ -184,7 +218,7 @@ class ProductListView(generics.ListAPIView):
     ordering = ['-created_at']
     
     def get_queryset(self):
-        queryset = Product.objects.select_related('category').all()
+        queryset = Product.objects.for_list()
         
         # Filter by active status
         is_active = self.request.query_params.get('is_active', None)
@@ -199,7 +233,7 @@ class ProductListView(generics.ListAPIView):
         # Filter by low stock
         low_stock = self.request.query_params.get('low_stock', None)
         if low_stock and low_stock.lower() == 'true':
-            queryset = queryset.filter(stock_quantity__lte=models.F('min_stock_level'))
+            queryset = queryset.filter(stock_quantity__lte=F('min_stock_level'))
         
         return queryset
 
@@ -250,7 +284,7 @@ class ProductSearchView(APIView):
             Q(sku__icontains=query) |
             Q(barcode__icontains=query),
             is_active=True
-        ).select_related('category')[:20]  # Limit to 20 results
+        ).for_list()[:20]  # Limit to 20 results
         
         serializer = ProductListSerializer(products, many=True)
         return Response({'results': serializer.data})
@@ -262,16 +296,17 @@ class LowStockProductsView(generics.ListAPIView):
     permission_classes = [IsManager]
     
     def get_queryset(self):
-        from django.db.models import F
-        return Product.objects.filter(
-            stock_quantity__lte=F('min_stock_level'),
+        return Product.objects.with_low_stock().filter(
+            low_stock=True,
             is_active=True
-        ).select_related('category')
+        ).for_list()
 
 
 class BulkProductUploadView(APIView):
     """Bulk upload products via CSV (Admin/Manager only)"""
     permission_classes = [IsManager]
+    chunk_size = 1000
+    required_fields = ('name', 'sku', 'price')
     
     def post(self, request):
         serializer = BulkProductUploadSerializer(data=request.data)
@@ -282,41 +317,24 @@ class BulkProductUploadView(APIView):
         csv_file = serializer.validated_data['csv_file']
         
         try:
-            # Read CSV file
-            decoded_file = csv_file.read().decode('utf-8')
-            io_string = io.StringIO(decoded_file)
-            reader = csv.DictReader(io_string)
+            # Stream the CSV instead of decoding the whole upload in memory
+            reader = csv.DictReader(io.TextIOWrapper(csv_file.file, encoding='utf-8', newline=''))
             
             created_count = 0
             errors = []
+            chunk = []
+            categories = {}  # name -> Category, shared by every chunk
             
             for row_num, row in enumerate(reader, start=2):
-                try:
-                    # Get or create category
-                    category = None
-                    if row.get('category'):
-                        category, _ = Category.objects.get_or_create(
-                            name=row['category']
-                        )
-                    
-                    # Create product
-                    Product.objects.create(
-                        name=row['name'],
-                        sku=row['sku'],
-                        barcode=row.get('barcode') or None,
-                        category=category,
-                        description=row.get('description', ''),
-                        price=float(row['price']),
-                        cost_price=float(row.get('cost_price', 0)),
-                        tax_rate=float(row.get('tax_rate', 0)),
-                        stock_quantity=int(row.get('stock_quantity', 0)),
-                        min_stock_level=int(row.get('min_stock_level', 10)),
-                        created_by=request.user
-                    )
-                    created_count += 1
-                    
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
+                chunk.append((row_num, row))
+                if len(chunk) >= self.chunk_size:
+                    created_count += self._create_chunk(chunk, request.user, errors, categories)
+                    chunk = []
+            if chunk:
+                created_count += self._create_chunk(chunk, request.user, errors, categories)
+            # bulk_create skips post_save, so drop the cached category counts and stats here
+            invalidate(CATEGORY_LIST_KEY)
+            invalidate_stats()
             
             return Response({
                 'message': f'Successfully created {created_count} products',
@@ -329,29 +347,115 @@ class BulkProductUploadView(APIView):
                 {'error': f'Error processing CSV file: {str(e)}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+    
+    @transaction.atomic
+    def _create_chunk(self, chunk, user, errors, categories):
+        """Insert one chunk of rows with a fixed number of queries"""
+        chunk = [(row_num, self._clean_row(row)) for row_num, row in chunk]
+        skus = [row.get('sku') for _, row in chunk if row.get('sku')]
+        barcodes = [row.get('barcode') for _, row in chunk if row.get('barcode')]
+        existing_skus = set(
+            Product.objects.filter(sku__in=skus).values_list('sku', flat=True)
+        )
+        existing_barcodes = set(
+            Product.objects.filter(barcode__in=barcodes).values_list('barcode', flat=True)
+        )
+        
+        # Get or create the categories this chunk names that earlier chunks didn't
+        names = {row['category'] for _, row in chunk if row.get('category')} - categories.keys()
+        if names:
+            found = Category.objects.in_bulk(names, field_name='name')
+            missing = [Category(name=name) for name in names - found.keys()]
+            if missing:
+                Category.objects.bulk_create(missing, ignore_conflicts=True)
+                found = Category.objects.in_bulk(names, field_name='name')
+            categories.update(found)
+        
+        products = []
+        for row_num, row in chunk:
+            try:
+                missing = [field for field in self.required_fields if not row.get(field)]
+                if missing:
+                    raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+                sku = row['sku']
+                barcode = row.get('barcode') or None
+                if sku in existing_skus:
+                    raise ValueError(f"Product with SKU {sku} already exists")
+                if barcode and barcode in existing_barcodes:
+                    raise ValueError(f"Product with barcode {barcode} already exists")
+                
+                products.append((row_num, Product(
+                    name=row['name'],
+                    sku=sku,
+                    barcode=barcode,
+                    category=categories.get(row.get('category')),
+                    description=row.get('description', ''),
+                    price=float(row['price']),
+                    cost_price=float(row.get('cost_price') or 0),
+                    tax_rate=float(row.get('tax_rate') or 0),
+                    stock_quantity=int(row.get('stock_quantity') or 0),
+                    min_stock_level=int(row.get('min_stock_level') or 10),
+                    created_by=user
+                )))
+                # Later rows in the same file can't reuse this SKU/barcode either
+                existing_skus.add(sku)
+                if barcode:
+                    existing_barcodes.add(barcode)
+                
+            except Exception as e:
+                errors.append(f"Row {row_num}: {str(e)}")
+        
+        if not products:
+            return 0
+        try:
+            # A savepoint, so a bad row or a SKU/barcode taken by another
+            # upload meanwhile only rolls back this insert
+            with transaction.atomic():
+                Product.objects.bulk_create([product for _, product in products], batch_size=self.chunk_size)
+            return len(products)
+        except (IntegrityError, DataError):
+            pass
+        
+        # Retry row by row so only the offending rows fail, each with its own error
+        created_count = 0
+        for row_num, product in products:
+            product.pk = None
+            try:
+                with transaction.atomic():
+                    Product.objects.bulk_create([product])
+                created_count += 1
+            except (IntegrityError, DataError) as e:
+                errors.append(f"Row {row_num}: {str(e)}")
+        return created_count
+    
+    @staticmethod
+    def _clean_row(row):
+        """Strip one CSV row's values; cells a short row lacks come back as ''"""
+        return {
+            key: (value or '').strip()
+            for key, value in row.items()
+            if key is not None  # cells past the header
+        }
 
 
 @api_view(['GET'])
 @permission_classes([IsManager])
 def product_stats_view(request):
     """Get product statistics"""
-    from django.db.models import Sum, Count, Avg, F
+    from django.db.models import Sum, Count, F, Q
     
-    stats = {
-        'total_products': Product.objects.filter(is_active=True).count(),
-        'total_categories': Category.objects.filter(is_active=True).count(),
-        'low_stock_products': Product.objects.filter(
-            stock_quantity__lte=F('min_stock_level'),
-            is_active=True
-        ).count(),
-        'out_of_stock_products': Product.objects.filter(
-            stock_quantity=0,
-            is_active=True
-        ).count(),
-        'total_stock_value': Product.objects.filter(is_active=True).aggregate(
-            total=Sum(F('stock_quantity') * F('cost_price'))
-        )['total'] or 0,
-    }
+    stats = cache.get(PRODUCT_STATS_KEY)
+    if stats is None:
+        # One pass over the active products for every product figure
+        stats = Product.objects.filter(is_active=True).aggregate(
+            total_products=Count('id'),
+            low_stock_products=Count('id', filter=Q(stock_quantity__lte=F('min_stock_level'))),
+            out_of_stock_products=Count('id', filter=Q(stock_quantity=0)),
+            total_stock_value=Sum(F('stock_quantity') * F('cost_price')),
+        )
+        stats['total_stock_value'] = stats['total_stock_value'] or 0
+        stats['total_categories'] = Category.objects.filter(is_active=True).count()
+        cache.set(PRODUCT_STATS_KEY, stats, STATS_CACHE_TIMEOUT)
     
     return Response(stats)
 
@@ -366,18 +470,14 @@ class SaleListView(generics.ListAPIView):
     ordering = ['-created_at']
     
     def get_queryset(self):
-        queryset = Sale.objects.select_related('cashier').all()
+        queryset = Sale.objects.select_related('cashier').only(
+            'id', 'invoice_number', 'cashier__id', 'cashier__username', 'customer_name',
+            'total', 'payment_method', 'status', 'created_at'
+        ).annotate(items_count=Count('items'))
         
         # Filter by date range
-        start_date = self.request.query_params.get('start_date', None)
-        end_date = self.request.query_params.get('end_date', None)
-        
-        if start_date:
-            queryset = queryset.filter(created_at__gte=start_date)
-        if end_date:
-            # Add one day to include the end date
-            end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-            queryset = queryset.filter(created_at__lt=end_datetime)
+        _, _, window = _report_window(self.request)
+        queryset = queryset.filter(**window)
         
         # Filter by cashier
         cashier_id = self.request.query_params.get('cashier', None)
@@ -419,7 +519,7 @@ class SaleCreateView(generics.CreateAPIView):
 
 class SaleDetailView(generics.RetrieveAPIView):
     """Get sale details"""
-    queryset = Sale.objects.select_related('cashier').prefetch_related('items', 'payments').all()
+    queryset = Sale.objects.with_all()
     serializer_class = SaleDetailSerializer
     permission_classes = [IsCashier]
     
@@ -441,22 +541,21 @@ def sales_stats_view(request):
     from django.db.models import Sum, Count, Avg
     
     # Date filters
-    start_date = request.query_params.get('start_date', None)
-    end_date = request.query_params.get('end_date', None)
+    start_date, end_date, window = _report_window(request)
     
-    queryset = Sale.objects.filter(status='completed')
-    
-    if start_date:
-        queryset = queryset.filter(created_at__gte=start_date)
-    if end_date:
-        end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-        queryset = queryset.filter(created_at__lt=end_datetime)
+    queryset = Sale.objects.filter(status='completed', **window)
     
     # If cashier, only their sales
     user = request.user
-    if user.is_cashier and not (user.is_admin or user.is_manager):
+    own_sales_only = user.is_cashier and not (user.is_admin or user.is_manager)
+    if own_sales_only:
         queryset = queryset.filter(cashier=user)
     
+    key = sales_stats_key(user.pk if own_sales_only else 'all', start_date, end_date)
+    stats = cache.get(key)
+    if stats is not None:
+        return Response(stats)
+    
     stats = queryset.aggregate(
         total_sales=Count('id'),
         total_revenue=Sum('total'),
@@ -471,10 +570,43 @@ def sales_stats_view(request):
     )
     
     stats['payment_breakdown'] = list(payment_breakdown)
+    cache.set(key, stats, STATS_CACHE_TIMEOUT)
     
     return Response(stats)
 
 
+def _int_param(request, name, default):
+    """Integer query parameter, falling back to `default` when it isn't one"""
+    try:
+        return int(request.query_params.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _report_window(request, field='created_at', default_days=None):
+    """
+    Parse a report's ?start_date=/?end_date= (YYYY-MM-DD) once into aware
+    range filters on `field`. Without a start_date the window opens
+    `default_days` ago when given. Returns (start_date, end_date, filters);
+    a date that doesn't parse is a 400.
+    """
+    start_date = request.query_params.get('start_date')
+    end_date = request.query_params.get('end_date')
+    if not start_date and default_days is not None:
+        start_date = timezone.localdate() - timedelta(days=default_days)
+    
+    filters = {}
+    try:
+        if start_date:
+            filters[f'{field}__gte'] = day_start(start_date)
+        if end_date:
+            # Exclusive bound at the next midnight so the end date is included
+            filters[f'{field}__lt'] = day_start(end_date, days=1)
+    except ValueError:
+        raise ValidationError({'error': 'start_date and end_date must be YYYY-MM-DD dates'})
+    return start_date, end_date, filters
+
+
 @api_view(['GET'])
 @permission_classes([IsManager])
 def top_selling_products_view(request):
@@ -482,33 +614,46 @@ def top_selling_products_view(request):
     from django.db.models import Sum, Count
     
     # Date filters
-    days = int(request.query_params.get('days', 30))
-    start_date = datetime.now() - timedelta(days=days)
+    days = _int_param(request, 'days', 30)
+    start_date = timezone.now() - timedelta(days=days)
     
+    # Group the window's lines by product_id alone; joining products into
+    # the GROUP BY would widen every grouped row just to name ten of them
     top_products = SaleItem.objects.filter(
         sale__created_at__gte=start_date,
         sale__status='completed'
     ).values(
-        'product__id',
-        'product__name',
-        'product__sku'
+        'product_id'
     ).annotate(
         total_quantity=Sum('quantity'),
         total_revenue=Sum('subtotal'),
         times_sold=Count('id')
-    ).order_by('-total_quantity')[:10]
+    ).order_by('-total_quantity', 'product_id')[:10]
+    
+    top_products = list(top_products)
+    products = Product.objects.only('name', 'sku').in_bulk(
+        [row['product_id'] for row in top_products]
+    )
     
-    return Response(list(top_products))
+    return Response([
+        {
+            'product__id': row['product_id'],
+            'product__name': products[row['product_id']].name,
+            'product__sku': products[row['product_id']].sku,
+            'total_quantity': row['total_quantity'],
+            'total_revenue': row['total_revenue'],
+            'times_sold': row['times_sold'],
+        }
+        for row in top_products
+    ])
 
 
 @api_view(['POST'])
 @permission_classes([IsManager])
 def cancel_sale_view(request, pk):
     """Cancel a sale (Admin/Manager only)"""
-    from django.db import transaction
-    
     try:
-        sale = Sale.objects.get(pk=pk)
+        sale = Sale.objects.with_all().get(pk=pk)
     except Sale.DoesNotExist:
         return Response(
             {'error': 'Sale not found'},
@@ -522,15 +667,24 @@ def cancel_sale_view(request, pk):
         )
     
     with transaction.atomic():
-        # Restore stock
-        for item in sale.items.all():
-            product = item.product
-            product.stock_quantity += item.quantity
-            product.save()
+        # Flip the status first so only one of two concurrent cancels restocks
+        cancelled = Sale.objects.filter(pk=sale.pk).exclude(
+            status='cancelled'
+        ).update(status='cancelled')
+        if not cancelled:
+            return Response(
+                {'error': 'Sale is already cancelled'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Update sale status
-        sale.status = 'cancelled'
-        sale.save()
+        # Restore stock with one UPDATE instead of a load and save per line
+        restock = {}
+        for item in sale.items.all():
+            restock[item.product_id] = restock.get(item.product_id, 0) + item.quantity
+        Product.objects.add_stock(restock)
+        transaction.on_commit(invalidate_stats)
+    
+    sale.status = 'cancelled'
     
     return Response({
         'message': 'Sale cancelled successfully',
@@ -562,9 +716,15 @@ class StockMovementListView(generics.ListAPIView):
     ordering = ['-created_at']
     
     def get_queryset(self):
+        # Only the columns StockMovementSerializer renders, joined rows included
         queryset = StockMovement.objects.select_related(
             'product', 'supplier', 'user'
-        ).all()
+        ).only(
+            'id', 'product', 'movement_type', 'quantity', 'previous_quantity',
+            'new_quantity', 'unit_cost', 'reference_number', 'supplier', 'sale',
+            'user', 'notes', 'created_at',
+            'product__name', 'product__sku', 'supplier__name', 'user__username'
+        )
         
         # Filter by product
         product_id = self.request.query_params.get('product', None)
@@ -595,22 +755,31 @@ class StockAdjustmentView(APIView):
         quantity = validated_data['quantity']
         
         with transaction.atomic():
-            previous_quantity = product.stock_quantity
+            products = Product.objects.filter(pk=product.pk)
             
-            # Calculate new quantity
-            if adjustment_type == 'add':
-                new_quantity = previous_quantity + quantity
-                movement_quantity = quantity
-            elif adjustment_type == 'remove':
-                new_quantity = previous_quantity - quantity
-                movement_quantity = -quantity
-            else:  # set
+            if adjustment_type == 'set':
+                previous_quantity = products.select_for_update().values_list(
+                    'stock_quantity', flat=True
+                ).get()
+                products.update(stock_quantity=quantity)
                 new_quantity = quantity
                 movement_quantity = quantity - previous_quantity
+            else:
+                # Apply the delta in SQL; a removal only matches while enough stock is left
+                movement_quantity = quantity if adjustment_type == 'add' else -quantity
+                if adjustment_type == 'remove':
+                    products = products.filter(stock_quantity__gte=quantity)
+                if not products.update(stock_quantity=F('stock_quantity') + movement_quantity):
+                    return Response(
+                        {'error': f'Cannot remove {quantity} units. Stock changed during the adjustment.'},
+                        status=status.HTTP_409_CONFLICT
+                    )
+                new_quantity = Product.objects.filter(pk=product.pk).values_list(
+                    'stock_quantity', flat=True
+                ).get()
+                previous_quantity = new_quantity - movement_quantity
             
-            # Update product stock
             product.stock_quantity = new_quantity
-            product.save()
             
             # Create stock movement record
             movement = StockMovement.objects.create(
@@ -634,6 +803,9 @@ class StockAdjustmentView(APIView):
                         'current_stock': new_quantity
                     }
                 )
+            
+            # The stock was written with update(), which sends no post_save
+            transaction.on_commit(invalidate_stats)
         
         return Response({
             'message': 'Stock adjusted successfully',
@@ -650,7 +822,9 @@ class PurchaseOrderListView(generics.ListAPIView):
     ordering = ['-created_at']
     
     def get_queryset(self):
-        queryset = PurchaseOrder.objects.select_related('supplier', 'created_by').all()
+        queryset = PurchaseOrder.objects.select_related(
+            'supplier', 'created_by'
+        ).annotate(items_count=Count('items'))
         
         # Filter by status
         po_status = self.request.query_params.get('status', None)
@@ -674,7 +848,7 @@ class PurchaseOrderCreateView(generics.CreateAPIView):
 
 
 class PurchaseOrderDetailView(generics.RetrieveAPIView):
-    queryset = PurchaseOrder.objects.prefetch_related('items__product').all()
+    queryset = PurchaseOrder.objects.with_all()
     serializer_class = PurchaseOrderDetailSerializer
     permission_classes = [IsManager]
 
@@ -684,7 +858,7 @@ class PurchaseOrderDetailView(generics.RetrieveAPIView):
 def receive_purchase_order(request, pk):
     """Mark purchase order as received and update stock"""
     try:
-        po = PurchaseOrder.objects.get(pk=pk)
+        po = PurchaseOrder.objects.with_all().get(pk=pk)
     except PurchaseOrder.DoesNotExist:
         return Response(
             {'error': 'Purchase order not found'},
@@ -698,23 +872,38 @@ def receive_purchase_order(request, pk):
         )
     
     with transaction.atomic():
-        # Update stock for each item
-        for item in po.items.all():
-            product = item.product
-            previous_quantity = product.stock_quantity
+        # Claim the PO first so a concurrent receive can't add the stock twice
+        now = timezone.now()
+        claimed = PurchaseOrder.objects.filter(pk=po.pk).exclude(
+            status='received'
+        ).update(status='received', received_date=now)
+        if not claimed:
+            return Response(
+                {'error': 'Purchase order already received'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        items = list(po.items.all())
+        received = {}
+        for item in items:
+            received[item.product_id] = received.get(item.product_id, 0) + item.quantity_ordered
+        
+        # Lock the products so the movements record the quantities we add to
+        stock = dict(
+            Product.objects.select_for_update()
+            .filter(pk__in=received)
+            .values_list('pk', 'stock_quantity')
+        )
+        
+        movements = []
+        for item in items:
+            previous_quantity = stock[item.product_id]
             new_quantity = previous_quantity + item.quantity_ordered
+            stock[item.product_id] = new_quantity
             
-            # Update product stock
-            product.stock_quantity = new_quantity
-            product.save()
-            
-            # Update item received quantity
             item.quantity_received = item.quantity_ordered
-            item.save()
-            
-            # Create stock movement
-            StockMovement.objects.create(
-                product=product,
+            movements.append(StockMovement(
+                product_id=item.product_id,
                 movement_type='purchase',
                 quantity=item.quantity_ordered,
                 previous_quantity=previous_quantity,
@@ -724,21 +913,24 @@ def receive_purchase_order(request, pk):
                 supplier=po.supplier,
                 user=request.user,
                 notes=f'Received from PO {po.po_number}'
-            )
-            
-            # Resolve low stock alerts if any
-            StockAlert.objects.filter(
-                product=product,
-                is_resolved=False
-            ).update(
-                is_resolved=True,
-                resolved_at=timezone.now()
-            )
+            ))
+        
+        Product.objects.add_stock(received)
+        po.items.update(quantity_received=F('quantity_ordered'))
+        StockMovement.objects.bulk_insert(movements, batch_size=500)
         
-        # Update PO status
-        po.status = 'received'
-        po.received_date = timezone.now()
-        po.save()
+        # Resolve low stock alerts if any
+        StockAlert.objects.filter(
+            product_id__in=received,
+            is_resolved=False
+        ).update(
+            is_resolved=True,
+            resolved_at=now
+        )
+        transaction.on_commit(invalidate_stats)
+    
+    po.status = 'received'
+    po.received_date = now
     
     return Response({
         'message': 'Purchase order received successfully',
@@ -750,22 +942,23 @@ def receive_purchase_order(request, pk):
 @permission_classes([IsManager])
 def cancel_purchase_order(request, pk):
     """Cancel a purchase order"""
-    try:
-        po = PurchaseOrder.objects.get(pk=pk)
-    except PurchaseOrder.DoesNotExist:
-        return Response(
-            {'error': 'Purchase order not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
+    cancelled = PurchaseOrder.objects.filter(pk=pk).exclude(
+        status='received'
+    ).update(status='cancelled')
     
-    if po.status == 'received':
+    if not cancelled:
+        if not PurchaseOrder.objects.filter(pk=pk).exists():
+            return Response(
+                {'error': 'Purchase order not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
         return Response(
             {'error': 'Cannot cancel a received purchase order'},
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    po.status = 'cancelled'
-    po.save()
+    invalidate(INVENTORY_STATS_KEY)
+    po = PurchaseOrder.objects.with_all().get(pk=pk)
     
     return Response({
         'message': 'Purchase order cancelled successfully',
@@ -789,22 +982,18 @@ def inventory_stats_view(request):
     """Get inventory statistics"""
     from django.db.models import Sum, Count, F, Q
     
-    stats = {
-        'total_products': Product.objects.filter(is_active=True).count(),
-        'total_stock_value': Product.objects.filter(is_active=True).aggregate(
-            total=Sum(F('stock_quantity') * F('cost_price'))
-        )['total'] or 0,
-        'low_stock_count': Product.objects.filter(
-            stock_quantity__lte=F('min_stock_level'),
-            is_active=True
-        ).count(),
-        'out_of_stock_count': Product.objects.filter(
-            stock_quantity=0,
-            is_active=True
-        ).count(),
-        'active_alerts': StockAlert.objects.filter(is_resolved=False).count(),
-        'pending_pos': PurchaseOrder.objects.filter(status='pending').count(),
-    }
+    stats = cache.get(INVENTORY_STATS_KEY)
+    if stats is None:
+        stats = Product.objects.filter(is_active=True).aggregate(
+            total_products=Count('id'),
+            total_stock_value=Sum(F('stock_quantity') * F('cost_price')),
+            low_stock_count=Count('id', filter=Q(stock_quantity__lte=F('min_stock_level'))),
+            out_of_stock_count=Count('id', filter=Q(stock_quantity=0)),
+        )
+        stats['total_stock_value'] = stats['total_stock_value'] or 0
+        stats['active_alerts'] = StockAlert.objects.filter(is_resolved=False).count()
+        stats['pending_pos'] = PurchaseOrder.objects.filter(status='pending').count()
+        cache.set(INVENTORY_STATS_KEY, stats, STATS_CACHE_TIMEOUT)
     
     return Response(stats)
 
@@ -813,26 +1002,13 @@ def inventory_stats_view(request):
 @permission_classes([IsManager])
 def sales_report_view(request):
     """Comprehensive sales report with filters"""
-    # Get date range from query params
-    start_date = request.query_params.get('start_date')
-    end_date = request.query_params.get('end_date')
+    # Get date range from query params, defaulting to the last 30 days
+    start_date, end_date, window = _report_window(request, default_days=30)
     period = request.query_params.get('period', 'daily')  # daily, weekly, monthly
     cashier_id = request.query_params.get('cashier')
     
     # Base queryset
-    queryset = Sale.objects.filter(status='completed')
-    
-    # Apply filters
-    if start_date:
-        queryset = queryset.filter(created_at__gte=start_date)
-    else:
-        # Default to last 30 days
-        start_date = (datetime.now() - timedelta(days=30)).date()
-        queryset = queryset.filter(created_at__gte=start_date)
-    
-    if end_date:
-        end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-        queryset = queryset.filter(created_at__lt=end_datetime)
+    queryset = Sale.objects.filter(status='completed', **window)
     
     if cashier_id:
         queryset = queryset.filter(cashier_id=cashier_id)
@@ -878,16 +1054,27 @@ def sales_report_view(request):
         total=Sum('total')
     )
     
-    # Top cashiers
-    top_cashiers = queryset.values(
-        'cashier__id',
-        'cashier__username',
-        'cashier__first_name',
-        'cashier__last_name'
-    ).annotate(
+    # Top cashiers: rank on cashier_id alone, then name just the ten
+    top_cashiers = list(queryset.values('cashier_id').annotate(
         total_sales=Count('id'),
         total_revenue=Sum('total')
-    ).order_by('-total_revenue')[:10]
+    ).order_by('-total_revenue', 'cashier_id')[:10])
+    cashiers = {
+        cashier['id']: cashier for cashier in User.objects.filter(
+            id__in=[row['cashier_id'] for row in top_cashiers]
+        ).values('id', 'username', 'first_name', 'last_name')
+    }
+    top_cashiers = [
+        {
+            'cashier__id': row['cashier_id'],
+            'cashier__username': cashiers[row['cashier_id']]['username'],
+            'cashier__first_name': cashiers[row['cashier_id']]['first_name'],
+            'cashier__last_name': cashiers[row['cashier_id']]['last_name'],
+            'total_sales': row['total_sales'],
+            'total_revenue': row['total_revenue'],
+        }
+        for row in top_cashiers
+    ]
     
     return Response({
         'period': period,
@@ -898,7 +1085,7 @@ def sales_report_view(request):
         'overall_stats': overall_stats,
         'sales_by_period': list(sales_by_period),
         'payment_breakdown': list(payment_breakdown),
-        'top_cashiers': list(top_cashiers)
+        'top_cashiers': top_cashiers
     })
 
 
@@ -906,21 +1093,16 @@ def sales_report_view(request):
 @permission_classes([IsManager])
 def product_performance_report_view(request):
     """Product performance and profitability report"""
-    start_date = request.query_params.get('start_date')
-    end_date = request.query_params.get('end_date')
-    limit = int(request.query_params.get('limit', 20))
-    
-    # Base queryset
-    queryset = SaleItem.objects.filter(sale__status='completed')
+    _, _, window = _report_window(request, field='day')
+    limit = _int_param(request, 'limit', 20)
     
-    # Apply date filters
-    if start_date:
-        queryset = queryset.filter(sale__created_at__gte=start_date)
-    if end_date:
-        end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-        queryset = queryset.filter(sale__created_at__lt=end_datetime)
+    # Base queryset: per-day product totals, pre-aggregated from the completed sales
+    queryset = DailyProductSales.objects.filter(**window)
     
-    # Top selling products by quantity
+    # Top selling products by quantity, with their profit worked out in the
+    # same query; products without a cost price report no profit
+    known_cost = Q(product__cost_price__gt=0)
+    money = DecimalField(max_digits=12, decimal_places=2)
     top_products_qty = queryset.values(
         'product__id',
         'product__name',
@@ -928,37 +1110,32 @@ def product_performance_report_view(request):
         'product__cost_price'
     ).annotate(
         total_quantity=Sum('quantity'),
-        total_revenue=Sum('subtotal'),
-        times_sold=Count('sale')
+        total_revenue=Sum('revenue'),
+        times_sold=Sum('times_sold'),
+        total_cost=Sum(F('quantity') * F('product__cost_price'), output_field=money)
+    ).annotate(
+        profit=Case(
+            # Rounded back to cents: SQLite sums decimals as floats
+            When(known_cost, then=Round(F('total_revenue') - F('total_cost'), 2)),
+            default=Value(Decimal('0')), output_field=money
+        ),
+        profit_margin=Case(
+            # No revenue means no margin rather than a division by zero
+            When(known_cost, then=Coalesce(
+                Round(F('profit') * Decimal('100') / NullIf(F('total_revenue'), 0), 2),
+                Value(Decimal('0'))
+            )),
+            default=Value(Decimal('0')), output_field=money
+        )
     ).order_by('-total_quantity')[:limit]
     
-    # Calculate profit for each product
-    top_products_list = list(top_products_qty)
-    for product in top_products_list:
-        cost_price = product['product__cost_price']
-        revenue = product['total_revenue']
-        quantity = product['total_quantity']
-        
-        if cost_price and quantity:
-            total_cost = cost_price * quantity
-            profit = revenue - total_cost
-            profit_margin = (profit / revenue * 100) if revenue > 0 else 0
-            
-            product['total_cost'] = float(total_cost)
-            product['profit'] = float(profit)
-            product['profit_margin'] = round(float(profit_margin), 2)
-        else:
-            product['total_cost'] = 0
-            product['profit'] = 0
-            product['profit_margin'] = 0
-    
     # Top products by revenue
     top_products_revenue = queryset.values(
         'product__id',
         'product__name',
         'product__sku'
     ).annotate(
-        total_revenue=Sum('subtotal'),
+        total_revenue=Sum('revenue'),
         total_quantity=Sum('quantity')
     ).order_by('-total_revenue')[:limit]
     
@@ -969,11 +1146,11 @@ def product_performance_report_view(request):
         'product__sku'
     ).annotate(
         total_quantity=Sum('quantity'),
-        total_revenue=Sum('subtotal')
+        total_revenue=Sum('revenue')
     ).order_by('total_quantity')[:10]
     
     return Response({
-        'top_products_by_quantity': top_products_list,
+        'top_products_by_quantity': list(top_products_qty),
         'top_products_by_revenue': list(top_products_revenue),
         'low_performing_products': list(low_performing)
     })
@@ -983,45 +1160,70 @@ def product_performance_report_view(request):
 @permission_classes([IsManager])
 def cashier_performance_report_view(request):
     """Cashier performance report"""
-    start_date = request.query_params.get('start_date')
-    end_date = request.query_params.get('end_date')
+    _, _, window = _report_window(request)
     
     # Base queryset
-    queryset = Sale.objects.filter(status='completed')
-    
-    # Apply date filters
-    if start_date:
-        queryset = queryset.filter(created_at__gte=start_date)
-    if end_date:
-        end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-        queryset = queryset.filter(created_at__lt=end_datetime)
-    
-    # Cashier performance
-    cashier_stats = queryset.values(
-        'cashier__id',
-        'cashier__username',
-        'cashier__first_name',
-        'cashier__last_name'
-    ).annotate(
-        total_sales=Count('id'),
-        total_revenue=Sum('total'),
-        average_sale=Avg('total'),
-        total_items_sold=Sum('items__quantity'),
-        total_discount_given=Sum('discount_amount')
-    ).order_by('-total_revenue')
+    queryset = Sale.objects.filter(status='completed', **window)
     
-    # Sales by payment method per cashier
-    cashier_payment_methods = queryset.values(
-        'cashier__username',
-        'payment_method'
-    ).annotate(
+    # One pass over the window's sales per (cashier, payment method); the
+    # per-cashier figures are folded from it below
+    by_method = list(queryset.values('cashier_id', 'payment_method').annotate(
         count=Count('id'),
-        total=Sum('total')
+        total=Sum('total'),
+        discount=Sum('discount_amount')
+    ).order_by('cashier_id', 'payment_method'))
+    
+    # Item quantities are summed on their own so joining the line items
+    # doesn't repeat each sale's figures once per item
+    items_sold = dict(
+        queryset.order_by().values('cashier_id').annotate(
+            quantity=Sum('items__quantity')
+        ).values_list('cashier_id', 'quantity')
     )
+    cashiers = {
+        cashier['id']: cashier for cashier in User.objects.filter(
+            id__in={row['cashier_id'] for row in by_method}
+        ).values('id', 'username', 'first_name', 'last_name')
+    }
+    
+    cashier_stats = {}
+    for row in by_method:
+        cashier = cashiers[row['cashier_id']]
+        stats = cashier_stats.get(cashier['id'])
+        if stats is None:
+            stats = cashier_stats[cashier['id']] = {
+                'cashier__id': cashier['id'],
+                'cashier__username': cashier['username'],
+                'cashier__first_name': cashier['first_name'],
+                'cashier__last_name': cashier['last_name'],
+                'total_sales': 0,
+                'total_revenue': 0,
+                'average_sale': None,
+                'total_items_sold': items_sold.get(cashier['id']),
+                'total_discount_given': 0,
+            }
+        stats['total_sales'] += row['count']
+        stats['total_revenue'] += row['total']
+        stats['total_discount_given'] += row['discount']
+    
+    for stats in cashier_stats.values():
+        stats['average_sale'] = stats['total_revenue'] / stats['total_sales']
+    cashier_stats = sorted(cashier_stats.values(), key=lambda stats: -stats['total_revenue'])
+    
+    # Sales by payment method per cashier
+    cashier_payment_methods = [
+        {
+            'cashier__username': cashiers[row['cashier_id']]['username'],
+            'payment_method': row['payment_method'],
+            'count': row['count'],
+            'total': row['total'],
+        }
+        for row in by_method
+    ]
     
     return Response({
-        'cashier_performance': list(cashier_stats),
-        'payment_methods_by_cashier': list(cashier_payment_methods)
+        'cashier_performance': cashier_stats,
+        'payment_methods_by_cashier': cashier_payment_methods
     })
 
 
@@ -1029,6 +1231,16 @@ def cashier_performance_report_view(request):
 @permission_classes([IsManager])
 def inventory_report_view(request):
     """Inventory valuation and status report"""
+    key = inventory_report_key()
+    report = cache.get(key)
+    if report is None:
+        report = _inventory_report()
+        cache.set(key, report, STATS_CACHE_TIMEOUT)
+    
+    return Response(report)
+
+
+def _inventory_report():
     from django.db.models import F
     
     # Stock valuation
@@ -1036,26 +1248,23 @@ def inventory_report_view(request):
         stock_value=F('stock_quantity') * F('cost_price')
     )
     
-    total_stock_value = products.aggregate(
-        total=Sum('stock_value')
-    )['total'] or 0
-    
-    # Stock status breakdown
-    in_stock = products.filter(stock_quantity__gt=F('min_stock_level')).count()
-    low_stock = products.filter(
-        stock_quantity__lte=F('min_stock_level'),
-        stock_quantity__gt=0
-    ).count()
-    out_of_stock = products.filter(stock_quantity=0).count()
+    # Valuation and stock status breakdown in one pass
+    stock = products.aggregate(
+        total=Sum('stock_value'),
+        in_stock=Count('id', filter=Q(stock_quantity__gt=F('min_stock_level'))),
+        low_stock=Count('id', filter=Q(stock_quantity__lte=F('min_stock_level'), stock_quantity__gt=0)),
+        out_of_stock=Count('id', filter=Q(stock_quantity=0)),
+    )
     
     # Top value inventory items
     top_value_items = products.order_by('-stock_value')[:10].values(
         'id', 'name', 'sku', 'stock_quantity', 'cost_price', 'stock_value'
     )
     
-    # Fast moving products (last 30 days)
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    fast_moving = SaleItem.objects.filter(
+    # Fast and slow moving products (last 30 days) are the two ends of one
+    # grouping; the stable sort keeps ties in product order for both
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    movement = list(SaleItem.objects.filter(
         sale__created_at__gte=thirty_days_ago,
         sale__status='completed'
     ).values(
@@ -1064,74 +1273,61 @@ def inventory_report_view(request):
         'product__sku'
     ).annotate(
         total_sold=Sum('quantity')
-    ).order_by('-total_sold')[:10]
+    ).order_by('-total_sold', 'product__id'))
+    fast_moving = movement[:10]
+    slow_moving = sorted(movement, key=lambda row: row['total_sold'])[:10]
     
-    # Slow moving products
-    slow_moving = SaleItem.objects.filter(
-        sale__created_at__gte=thirty_days_ago,
-        sale__status='completed'
-    ).values(
-        'product__id',
-        'product__name',
-        'product__sku'
-    ).annotate(
-        total_sold=Sum('quantity')
-    ).order_by('total_sold')[:10]
-    
-    return Response({
-        'total_stock_value': float(total_stock_value),
+    return {
+        'total_stock_value': float(stock['total'] or 0),
         'stock_status': {
-            'in_stock': in_stock,
-            'low_stock': low_stock,
-            'out_of_stock': out_of_stock
+            'in_stock': stock['in_stock'],
+            'low_stock': stock['low_stock'],
+            'out_of_stock': stock['out_of_stock']
         },
         'top_value_items': list(top_value_items),
-        'fast_moving_products': list(fast_moving),
-        'slow_moving_products': list(slow_moving)
-    })
+        'fast_moving_products': fast_moving,
+        'slow_moving_products': slow_moving
+    }
 
 
 @api_view(['GET'])
 @permission_classes([IsManager])
 def dashboard_stats_view(request):
     """Dashboard overview statistics"""
-    # Get date range (default last 30 days)
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    seven_days_ago = datetime.now() - timedelta(days=7)
-    today = datetime.now().date()
+    stats = cache.get(DASHBOARD_STATS_KEY)
+    if stats is None:
+        stats = _dashboard_stats()
+        cache.set(DASHBOARD_STATS_KEY, stats, STATS_CACHE_TIMEOUT)
     
-    # Sales statistics
-    total_sales = Sale.objects.filter(status='completed').count()
-    sales_today = Sale.objects.filter(
-        status='completed',
-        created_at__date=today
-    ).aggregate(
-        count=Count('id'),
-        revenue=Sum('total')
-    )
-    
-    sales_this_week = Sale.objects.filter(
-        status='completed',
-        created_at__gte=seven_days_ago
-    ).aggregate(
-        count=Count('id'),
-        revenue=Sum('total')
-    )
-    
-    sales_this_month = Sale.objects.filter(
-        status='completed',
-        created_at__gte=thirty_days_ago
-    ).aggregate(
-        count=Count('id'),
-        revenue=Sum('total')
+    return Response(stats)
+
+
+def _dashboard_stats():
+    # Get date range (default last 30 days)
+    now = timezone.now()
+    thirty_days_ago = now - timedelta(days=30)
+    seven_days_ago = now - timedelta(days=7)
+    today = timezone.localdate(now)
+    
+    # Sales statistics: every window in one pass over the completed sales
+    today_q = Q(created_at__date=today)
+    week_q = Q(created_at__gte=seven_days_ago)
+    month_q = Q(created_at__gte=thirty_days_ago)
+    sales = Sale.objects.filter(status='completed').aggregate(
+        total_sales=Count('id'),
+        today_count=Count('id', filter=today_q),
+        today_revenue=Sum('total', filter=today_q),
+        week_count=Count('id', filter=week_q),
+        week_revenue=Sum('total', filter=week_q),
+        month_count=Count('id', filter=month_q),
+        month_revenue=Sum('total', filter=month_q),
     )
     
     # Product statistics
-    total_products = Product.objects.filter(is_active=True).count()
-    low_stock_count = Product.objects.filter(
-        stock_quantity__lte=F('min_stock_level'),
-        is_active=True
-    ).count()
+    products = Product.objects.filter(is_active=True).aggregate(
+        total=Count('id'),
+        low_stock=Count('id', filter=Q(stock_quantity__lte=F('min_stock_level'))),
+    )
     
     # Recent sales trend (last 7 days)
     sales_trend = Sale.objects.filter(
@@ -1144,62 +1340,118 @@ def dashboard_stats_view(request):
         revenue=Sum('total')
     ).order_by('date')
     
-    return Response({
-        'total_sales': total_sales,
+    return {
+        'total_sales': sales['total_sales'],
         'today': {
-            'sales': sales_today['count'] or 0,
-            'revenue': float(sales_today['revenue'] or 0)
+            'sales': sales['today_count'],
+            'revenue': float(sales['today_revenue'] or 0)
         },
         'this_week': {
-            'sales': sales_this_week['count'] or 0,
-            'revenue': float(sales_this_week['revenue'] or 0)
+            'sales': sales['week_count'],
+            'revenue': float(sales['week_revenue'] or 0)
         },
         'this_month': {
-            'sales': sales_this_month['count'] or 0,
-            'revenue': float(sales_this_month['revenue'] or 0)
+            'sales': sales['month_count'],
+            'revenue': float(sales['month_revenue'] or 0)
         },
-        'total_products': total_products,
-        'low_stock_alerts': low_stock_count,
+        'total_products': products['total'],
+        'low_stock_alerts': products['low_stock'],
         'sales_trend': list(sales_trend)
-    })
+    }
 
 
 @api_view(['GET'])
 @permission_classes([IsManager])
 def export_sales_report_csv(request):
     """Export sales report as CSV"""
-    start_date = request.query_params.get('start_date')
-    end_date = request.query_params.get('end_date')
-    
-    queryset = Sale.objects.filter(status='completed').select_related('cashier')
+    _, _, window = _report_window(request)
     
-    if start_date:
-        queryset = queryset.filter(created_at__gte=start_date)
-    if end_date:
-        end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-        queryset = queryset.filter(created_at__lt=end_datetime)
-    
-    # Create CSV response
-    response = HttpResponse(content_type='text/csv')
+    sales = Sale.objects.filter(status='completed', **window)
+    if connection.vendor == 'postgresql':
+        response = FileResponse(_copy_sales_csv(sales), content_type='text/csv')
+    else:
+        # Plain tuples of just the exported columns, read from the cursor in chunks
+        rows = sales.values_list(
+            'invoice_number', 'created_at', 'cashier__username', 'customer_name',
+            'subtotal', 'tax_amount', 'discount_amount', 'total', 'payment_method'
+        ).iterator(chunk_size=2000)
+        response = StreamingHttpResponse(_sales_csv_lines(rows), content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="sales_report.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow([
-        'Invoice Number', 'Date', 'Cashier', 'Customer',
-        'Subtotal', 'Tax', 'Discount', 'Total', 'Payment Method'
-    ])
-    
-    for sale in queryset:
-        writer.writerow([
-            sale.invoice_number,
-            sale.created_at.strftime('%Y-%m-%d %H:%M'),
-            sale.cashier.username,
-            sale.customer_name or 'Walk-in',
-            sale.subtotal,
-            sale.tax_amount,
-            sale.discount_amount,
-            sale.total,
-            sale.get_payment_method_display()
+    return response
+
+
+class _Echo:
+    """csv.writer target that hands each formatted line back instead of buffering it"""
+    def write(self, value):
+        return value
+
+
+_SALES_CSV_HEADER = [
+    'Invoice Number', 'Date', 'Cashier', 'Customer',
+    'Subtotal', 'Tax', 'Discount', 'Total', 'Payment Method'
+]
+
+
+def _sales_csv_lines(rows, block_size=64 * 1024):
+    """Yield the export in ~64 KiB blocks rather than one tiny chunk per row"""
+    writer = csv.writer(_Echo())
+    block = [writer.writerow(_SALES_CSV_HEADER)]
+    size = len(block[0])
+    for (invoice_number, created_at, cashier, customer_name,
+         subtotal, tax_amount, discount_amount, total, payment_method) in rows:
+        line = writer.writerow([
+            invoice_number,
+            created_at.strftime('%Y-%m-%d %H:%M'),
+            cashier,
+            customer_name or 'Walk-in',
+            subtotal,
+            tax_amount,
+            discount_amount,
+            total,
+            _PAYMENT_METHOD_DISPLAY.get(payment_method, payment_method)
         ])
-    
-    return response
\ No newline at end of file
+        block.append(line)
+        size += len(line)
+        if size >= block_size:
+            yield ''.join(block)
+            block, size = [], 0
+    if block:
+        yield ''.join(block)
+
+
+def _copy_sales_csv(sales):
+    """
+    Have Postgres format the rows the way _sales_csv_lines does and write
+    them with COPY, skipping per-row Python work. The output is spooled so
+    the connection is released before the download starts.
+    """
+    # Every column is an annotation so the SELECT list keeps the header's order
+    rows = sales.annotate(
+        csv_invoice_number=F('invoice_number'),
+        csv_date=Func(
+            F('created_at'), Value('YYYY-MM-DD HH24:MI'),
+            function='to_char', output_field=CharField()
+        ),
+        csv_cashier=F('cashier__username'),
+        csv_customer=Coalesce(NullIf('customer_name', Value('')), Value('Walk-in')),
+        csv_subtotal=F('subtotal'),
+        csv_tax=F('tax_amount'),
+        csv_discount=F('discount_amount'),
+        csv_total=F('total'),
+        csv_payment_method=Case(
+            *[When(payment_method=value, then=Value(label)) for value, label in _PAYMENT_METHOD_DISPLAY.items()],
+            default=F('payment_method')
+        ),
+    ).values_list(
+        'csv_invoice_number', 'csv_date', 'csv_cashier', 'csv_customer', 'csv_subtotal',
+        'csv_tax', 'csv_discount', 'csv_total', 'csv_payment_method'
+    )
+    sql, params = rows.query.sql_with_params()
+    
+    output = tempfile.SpooledTemporaryFile(max_size=10 * 1024 * 1024)
+    output.write((','.join(_SALES_CSV_HEADER) + '\n').encode())
+    with connection.cursor() as cursor:
+        query = cursor.mogrify(sql, params).decode()
+        cursor.copy_expert(f'COPY ({query}) TO STDOUT WITH CSV', output)
+    output.seek(0)
+    return output
\ No newline at end of file
@@ -1,23 +1,11 @@
 #!/usr/bin/env python
+"""Kept for old scripts; prefer `python manage.py fix_admin_roles`"""
 import os
 import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pos_backend.settings')
 django.setup()
 
-from core.models import User, Role
+from django.core.management import call_command
 
-print("🔧 Fixing admin user roles...\n")
-
-admin_role = Role.objects.get(name='admin')
-
-# Get all superusers
-superusers = User.objects.filter(is_superuser=True)
-
-for user in superusers:
-    old_role = user.role.name if user.role else 'No Role'
-    user.role = admin_role
-    user.save()
-    print(f"✅ {user.username}: {old_role} → admin")
-
-print("\n✅ Done!")
+call_command('fix_admin_roles')